@@ -13,16 +13,28 @@ Run with: python -m a2a.server
 
 import os
 import sys
+import atexit
+import copy
 import json
 import uuid
 import time
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 from functools import wraps
 
 from flask import Flask, request, jsonify, Response, g
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON responses when installed
+    orjson = None
+
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
 
@@ -79,6 +91,8 @@ class A2AServer:
         self,
         tasks_path: Optional[str] = None,
         dialect: str = "sqlite",
+        batch_workers: int = 8,
+        cache_size: int = 256,
     ):
         """
         Initialize the A2A server.
@@ -86,8 +100,13 @@ class A2AServer:
         Args:
             tasks_path: Path to gold queries JSON file
             dialect: Default SQL dialect
+            batch_workers: Maximum threads used to evaluate a batch
+            cache_size: Evaluations of read-only queries kept for reuse
+                (0 disables the cache)
         """
         self.dialect = dialect
+        self.batch_workers = batch_workers
+        self.cache_size = cache_size
         self.tasks_path = tasks_path or self._default_tasks_path()
 
         # In-memory state (use Redis/DB for production)
@@ -103,6 +122,26 @@ class A2AServer:
         self._executor = None
         self._scorer = None
 
+        # Every executor (the shared one and one per batch worker thread)
+        # opens the same database file, so serial and batch submissions see
+        # the same data. Workers keep their executor until close().
+        self._database_dir: Optional[tempfile.TemporaryDirectory] = None
+        self._executor_lock = threading.Lock()
+        self._batch_pool: Optional[ThreadPoolExecutor] = None
+        self._batch_local = threading.local()
+        self._worker_executors: List[Any] = []
+
+        # Bumped whenever a submission may have changed the database;
+        # executors re-read the schema when they fall behind it
+        self._data_generation = 0
+        self._schema_generations: Dict[Any, int] = {}
+
+        # LRU of (task_id, SQL text) -> EvaluationResult for read-only
+        # submissions. Submissions may modify the database, so it is
+        # emptied whenever a non-read-only statement runs.
+        self._evaluation_cache: "OrderedDict[Tuple[str, str], EvaluationResult]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+
     def _default_tasks_path(self) -> str:
         """Get default tasks path."""
         base = os.path.dirname(os.path.dirname(__file__))
@@ -133,15 +172,65 @@ class A2AServer:
     def _get_executor(self):
         """Lazy-load the SQL executor."""
         if self._executor is None:
-            from agentx import SQLExecutor, ExecutorConfig
-
-            self._executor = SQLExecutor(ExecutorConfig(dialect=self.dialect))
-
-            # Create sample tables for evaluation
-            self._setup_sample_data()
+            self._executor = self._create_executor()
 
         return self._executor
 
+    def _create_executor(self):
+        """Create an SQL executor on the evaluation database."""
+        from agentx import SQLExecutor, ExecutorConfig
+
+        with self._executor_lock:
+            first = self._database_dir is None
+            if first:
+                self._database_dir = tempfile.TemporaryDirectory(prefix="agentx-a2a-")
+            db_path = os.path.join(self._database_dir.name, "evaluation.db")
+            executor = SQLExecutor(ExecutorConfig(dialect=self.dialect, db_path=db_path))
+
+            # Create sample tables for evaluation, once per database
+            if first:
+                with executor.adapter.transaction(durable=False):
+                    self._setup_sample_data(executor)
+
+            self._schema_generations[executor] = self._data_generation
+        return executor
+
+    def _refresh_if_stale(self, executor) -> None:
+        """Re-read the schema if a submission may have changed it since."""
+        with self._executor_lock:
+            generation = self._data_generation
+            stale = self._schema_generations.get(executor, generation) != generation
+            self._schema_generations[executor] = generation
+        if stale:
+            executor.refresh_schema()
+
+    def _data_changed(self) -> None:
+        """Note that a submission may have modified the database."""
+        with self._executor_lock:
+            self._data_generation += 1
+        with self._cache_lock:
+            self._evaluation_cache.clear()
+
+    def close(self) -> None:
+        """Stop the batch workers and close every executor's connection."""
+        with self._executor_lock:
+            pool, self._batch_pool = self._batch_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+
+        with self._executor_lock:
+            executors = self._worker_executors
+            self._worker_executors = []
+            if self._executor is not None:
+                executors.append(self._executor)
+                self._executor = None
+            self._schema_generations.clear()
+            database_dir, self._database_dir = self._database_dir, None
+        for executor in executors:
+            executor.close()
+        if database_dir is not None:
+            database_dir.cleanup()
+
     def _get_scorer(self):
         """Lazy-load the enhanced scorer."""
         if self._scorer is None:
@@ -149,9 +238,8 @@ class A2AServer:
             self._scorer = EnhancedScorer()
         return self._scorer
 
-    def _setup_sample_data(self):
+    def _setup_sample_data(self, executor):
         """Setup sample data for evaluation."""
-        executor = self._executor
 
         # Create customers table
         executor.adapter.execute("""
@@ -232,6 +320,11 @@ class A2AServer:
     def get_tasks(self, task_request: TaskRequest) -> TaskResponse:
         """Get available tasks based on filter criteria."""
         filtered_tasks = []
+        wanted_tags = set(task_request.tags) if task_request.tags else None
+
+        # Every task shares the same schema, so it is serialized once per
+        # request rather than once per task
+        schema_info = None
 
         for task in self.tasks.values():
             # Apply filters
@@ -239,13 +332,13 @@ class A2AServer:
                 continue
             if task_request.difficulty and task.difficulty != task_request.difficulty:
                 continue
-            if task_request.tags:
-                if not any(tag in task.tags for tag in task_request.tags):
-                    continue
+            if wanted_tags and wanted_tags.isdisjoint(task.tags):
+                continue
 
             # Add schema info
-            executor = self._get_executor()
-            task.schema_info = executor.get_schema_info()
+            if schema_info is None:
+                schema_info = self._get_executor().get_schema_info()
+            task.schema_info = schema_info
 
             filtered_tasks.append(task)
 
@@ -264,16 +357,62 @@ class A2AServer:
 
         # Validate task exists
         if task_id not in self.tasks:
-            return EvaluationResult(
-                task_id=task_id,
-                status="error",
-                error_message=f"Unknown task: {task_id}",
-            )
+            return self._unknown_task_result(task_id)
 
-        task = self.tasks[task_id]
-        executor = self._get_executor()
-        scorer = self._get_scorer()
+        eval_result = self._score_submission(
+            task_id, sql, self._get_executor(), self._get_scorer()
+        )
 
+        # Store result
+        if eval_request.agent_id in self.results:
+            self.results[eval_request.agent_id].append(eval_result)
+
+        return eval_result
+
+    @staticmethod
+    def _unknown_task_result(task_id: str) -> EvaluationResult:
+        """Error result for a submission against a task we don't know."""
+        return EvaluationResult(
+            task_id=task_id,
+            status="error",
+            error_message=f"Unknown task: {task_id}",
+        )
+
+    def _score_submission(self, task_id: str, sql: str, executor, scorer) -> EvaluationResult:
+        """Execute and score one submission without recording it."""
+        self._refresh_if_stale(executor)
+        if not executor.is_read_only(sql):
+            try:
+                return self._score_uncached(task_id, sql, executor, scorer)
+            finally:
+                self._data_changed()
+
+        # Keyed on the exact SQL text: scoring looks at the query's spelling
+        # and result column names, so normalized variants may score differently.
+        if self.cache_size <= 0:
+            return self._score_uncached(task_id, sql, executor, scorer)
+
+        key = (task_id, sql)
+        with self._cache_lock:
+            cached = self._evaluation_cache.get(key)
+            if cached is not None:
+                self._evaluation_cache.move_to_end(key)
+        if cached is not None:
+            return copy.deepcopy(cached)
+
+        generation = self._data_generation
+        eval_result = self._score_uncached(task_id, sql, executor, scorer)
+        with self._cache_lock:
+            # Skip results that may predate a concurrent modification
+            if generation == self._data_generation:
+                self._evaluation_cache[key] = copy.deepcopy(eval_result)
+                if len(self._evaluation_cache) > self.cache_size:
+                    self._evaluation_cache.popitem(last=False)
+
+        return eval_result
+
+    def _score_uncached(self, task_id: str, sql: str, executor, scorer) -> EvaluationResult:
+        """Execute and score one submission."""
         # Process the query
         result = executor.process_query(sql, verbose=False)
 
@@ -350,33 +489,36 @@ class A2AServer:
             if score.best_practices_report:
                 eval_result.suggestions = score.best_practices_report.get("suggestions", [])
 
-        # Store result
-        if eval_request.agent_id in self.results:
-            self.results[eval_request.agent_id].append(eval_result)
-
         return eval_result
 
     def evaluate_batch(self, batch_request: BatchEvaluationRequest) -> EvaluationResponse:
         """Evaluate multiple SQL submissions."""
-        results = []
-
-        for submission in batch_request.submissions:
-            eval_req = EvaluationRequest(
+        eval_reqs = [
+            EvaluationRequest(
                 agent_id=batch_request.agent_id,
                 task_id=submission["task_id"],
                 sql=submission["sql"],
                 session_id=batch_request.session_id,
             )
-            result = self.evaluate_submission(eval_req)
-            results.append(result)
+            for submission in batch_request.submissions
+        ]
 
-        # Calculate summary
+        if min(self.batch_workers, len(eval_reqs)) > 1:
+            results = self._evaluate_parallel(eval_reqs)
+        else:
+            results = [self.evaluate_submission(eval_req) for eval_req in eval_reqs]
+
+        # Calculate summary in one pass
         total = len(results)
-        successful = sum(1 for r in results if r.status == "success")
-        avg_score = 0.0
-        if successful > 0:
-            scores = [r.scores.overall for r in results if r.scores]
-            avg_score = sum(scores) / len(scores) if scores else 0.0
+        successful = scored = 0
+        score_sum = 0.0
+        for r in results:
+            if r.status == "success":
+                successful += 1
+            if r.scores:
+                scored += 1
+                score_sum += r.scores.overall
+        avg_score = score_sum / scored if successful > 0 and scored else 0.0
 
         return EvaluationResponse(
             request_id=str(uuid.uuid4()),
@@ -390,6 +532,55 @@ class A2AServer:
             },
         )
 
+    def _evaluate_parallel(self, eval_reqs: List[EvaluationRequest]) -> List[EvaluationResult]:
+        """
+        Evaluate submissions on a thread pool, returning results in order.
+
+        Each worker thread keeps its own executor (and scorer) on the shared
+        evaluation database across batches. Results are recorded afterwards
+        on the calling thread to keep per-agent history in submission order.
+        """
+        local = self._batch_local
+
+        def evaluate(eval_req: EvaluationRequest) -> EvaluationResult:
+            if eval_req.task_id not in self.tasks:
+                return self._unknown_task_result(eval_req.task_id)
+            return self._score_submission(
+                eval_req.task_id, eval_req.sql, local.executor, local.scorer
+            )
+
+        pool = self._get_batch_pool()
+        results = list(pool.map(evaluate, eval_reqs))
+
+        for eval_req, result in zip(eval_reqs, results):
+            if eval_req.task_id in self.tasks and eval_req.agent_id in self.results:
+                self.results[eval_req.agent_id].append(result)
+
+        return results
+
+    def _get_batch_pool(self) -> ThreadPoolExecutor:
+        """Lazily start the batch worker threads."""
+        from evaluation.enhanced_scorer import EnhancedScorer
+
+        # Make sure the sample data exists before workers connect
+        self._get_executor()
+
+        def init_worker():
+            local = self._batch_local
+            local.executor = self._create_executor()
+            local.scorer = EnhancedScorer()
+            with self._executor_lock:
+                self._worker_executors.append(local.executor)
+
+        with self._executor_lock:
+            if self._batch_pool is None:
+                self._batch_pool = ThreadPoolExecutor(
+                    max_workers=self.batch_workers,
+                    initializer=init_worker,
+                    thread_name_prefix="a2a-batch",
+                )
+            return self._batch_pool
+
     def get_leaderboard(self, limit: int = 10) -> List[LeaderboardEntry]:
         """Get the benchmark leaderboard."""
         entries = []
@@ -399,18 +590,27 @@ class A2AServer:
             if not results:
                 continue
 
-            # Calculate stats
-            successful = [r for r in results if r.scores]
-            if not successful:
+            # Calculate stats in one pass over the scored results
+            completed = 0
+            overall_sum = correctness_sum = efficiency_sum = safety_sum = 0.0
+            for r in results:
+                scores = r.scores
+                if scores:
+                    completed += 1
+                    overall_sum += scores.overall
+                    correctness_sum += scores.correctness
+                    efficiency_sum += scores.efficiency
+                    safety_sum += scores.safety
+            if not completed:
                 continue
 
-            avg_score = sum(r.scores.overall for r in successful) / len(successful)
+            avg_score = overall_sum / completed
 
             # Scores by dimension
             dim_scores = {
-                "correctness": sum(r.scores.correctness for r in successful) / len(successful),
-                "efficiency": sum(r.scores.efficiency for r in successful) / len(successful),
-                "safety": sum(r.scores.safety for r in successful) / len(successful),
+                "correctness": correctness_sum / completed,
+                "efficiency": efficiency_sum / completed,
+                "safety": safety_sum / completed,
             }
 
             # Scores by difficulty (would need task lookup)
@@ -420,7 +620,7 @@ class A2AServer:
                 agent_id=agent_id,
                 agent_name=agent.agent_name,
                 total_tasks=len(results),
-                completed_tasks=len(successful),
+                completed_tasks=completed,
                 average_score=round(avg_score, 4),
                 scores_by_dimension=dim_scores,
                 scores_by_difficulty=diff_scores,
@@ -436,6 +636,43 @@ class A2AServer:
         return self.results.get(agent_id, [])
 
 
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson.
+
+    Handles the compact and indented encodings Flask asks for when building
+    responses; anything else (custom dump arguments) goes through the
+    default provider. Dates, dataclasses and other types orjson would encode
+    differently are passed to Flask's default handler, so responses keep
+    their current shape.
+    """
+
+    _OPTIONS = (
+        orjson.OPT_SORT_KEYS
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    ) if orjson is not None else 0
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        if kwargs == {"indent": 2}:
+            option = self._OPTIONS | orjson.OPT_INDENT_2
+        elif not kwargs or kwargs == {"separators": (",", ":")}:
+            option = self._OPTIONS
+        else:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=option).decode()
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits
+            return super().dumps(obj, **kwargs)
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        if kwargs:
+            return super().loads(s, **kwargs)
+        return orjson.loads(s)
+
+
 def create_app(
     tasks_path: Optional[str] = None,
     dialect: str = "sqlite",
@@ -451,10 +688,13 @@ def create_app(
         Configured Flask app
     """
     app = Flask(__name__)
+    if orjson is not None:
+        app.json = OrjsonJSONProvider(app)
     CORS(app)
 
     # Initialize server
     server = A2AServer(tasks_path=tasks_path, dialect=dialect)
+    atexit.register(server.close)
 
     # Store server on app for access in routes
     app.a2a_server = server
@@ -467,7 +707,7 @@ def create_app(
     def log_request_start():
         """Log incoming request and set timing."""
         g.request_id = str(uuid.uuid4())[:8]
-        g.start_time = time.time()
+        g.start_time = time.perf_counter()
 
         # Log request (skip health checks to reduce noise)
         if request.path != "/health":
@@ -483,7 +723,7 @@ def create_app(
     def log_request_complete(response):
         """Log request completion with timing."""
         if hasattr(g, "start_time") and request.path != "/health":
-            duration_ms = (time.time() - g.start_time) * 1000
+            duration_ms = (time.perf_counter() - g.start_time) * 1000
             logger.info(
                 "Request completed",
                 request_id=getattr(g, "request_id", "unknown"),
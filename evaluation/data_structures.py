@@ -67,7 +67,7 @@ class QueryPlan:
     plan_nodes: List[Dict[str, Any]] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class MultiDimensionalScore:
     """
     Multi-dimensional weighted score for a task.
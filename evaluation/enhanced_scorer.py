@@ -18,8 +18,13 @@ Usage:
                          sql=query, dialect="sqlite", expected=expected_results)
 """
 
+import re
+from bisect import bisect_left
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from functools import cached_property, lru_cache
+from operator import attrgetter, mul
+from types import MappingProxyType
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
 
 from evaluation.data_structures import (
     ComparisonResult,
@@ -38,12 +43,145 @@ from evaluation.advanced_scoring import (
     SemanticAccuracyScorer,
     SemanticAccuracyResult,
     ErrorTaxonomyClassifier,
+    ErrorClassification,
     SQLBestPracticesScorer,
     BestPracticesReport,
 )
 
 
-@dataclass
+# Classifies a validation error as a phantom table, column or function in
+# one scan. The branches are anchored and tried in order, so an error that
+# mentions both a table and a column is still bucketed as a table.
+_HALLUCINATION_RE = re.compile(
+    r"(?=.*table)(?=.*not exist)(?P<table>)"
+    r"|(?=.*column)(?=.*not exist)(?P<column>)"
+    r"|(?=.*function)(?=.*(?:not exist|invalid))(?P<function>)",
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Keywords that mark a validation error as a hallucination (legacy scoring)
+_HALLUCINATION_KEYWORDS_RE = re.compile(
+    r"does not exist|unknown column|unknown table|invalid|not found|no such",
+    re.IGNORECASE,
+)
+
+# Classifies an execution insight for the completeness penalty. Branches are
+# tried in order, so an insight matching several keywords takes the first.
+_INSIGHT_RE = re.compile(
+    r"(?=.*(?:no results|empty))(?P<empty>)"
+    r"|(?=.*truncated)(?P<truncated>)"
+    r"|(?=.*null)(?P<null>)"
+    r"|(?=.*(?:slow|long))(?P<slow>)",
+    re.IGNORECASE | re.DOTALL,
+)
+_INSIGHT_PENALTIES = {"empty": 0.2, "truncated": 0.1, "null": 0.05, "slow": 0.1}
+
+
+# Legacy fixed efficiency curve. Each segment of the piecewise-linear curve
+# is (start_ms, width_ms, start_score, score_drop); the segment is picked by
+# bisecting the breakpoints instead of walking an if/elif ladder.
+_LEGACY_THRESHOLDS = {"excellent": 10, "good": 100, "acceptable": 1000}
+_LEGACY_BREAKPOINTS = (10.0, 100.0, 1000.0)
+_LEGACY_SEGMENTS = (
+    (0.0, 1.0, 1.0, 0.0),          # <= 10ms: excellent
+    (10.0, 90.0, 1.0, 0.2),        # <= 100ms: 1.0 -> 0.8
+    (100.0, 900.0, 0.8, 0.3),      # <= 1000ms: 0.8 -> 0.5
+    (1000.0, 10000.0, 0.5, 1.0),   # beyond: 0.5 -> 0.0
+)
+
+
+def _legacy_efficiency(time_ms: float) -> float:
+    """Score execution time against the fixed 10/100/1000ms thresholds."""
+    start, width, start_score, drop = _LEGACY_SEGMENTS[bisect_left(_LEGACY_BREAKPOINTS, time_ms)]
+    return max(0.0, start_score - drop * ((time_ms - start) / width))
+
+
+# =============================================================================
+# CACHED SQL ANALYSIS
+# =============================================================================
+
+# The SQL-only analyzers are stateless, so they are shared by every
+# EnhancedScorer and their reports memoized by query text. Repeated scoring
+# of the same SQL (retries, preset sweeps) then skips the regex/AST scans.
+# Cached reports are shared and must be treated as read-only.
+_SHARED_COMPLEXITY_ANALYZER = QueryComplexityAnalyzer()
+_SHARED_BEST_PRACTICES_SCORER = SQLBestPracticesScorer()
+
+
+@lru_cache(maxsize=1024)
+def _cached_complexity(
+    analyzer: QueryComplexityAnalyzer,
+    sql: str,
+    tables_key: Tuple[str, ...],
+) -> QueryComplexityReport:
+    """Memoized QueryComplexityAnalyzer.analyze keyed by SQL and tables accessed."""
+    return analyzer.analyze(sql, parsed_info={"tables_accessed": list(tables_key)})
+
+
+@lru_cache(maxsize=1024)
+def _cached_best_practices(
+    scorer: SQLBestPracticesScorer,
+    sql: str,
+    dialect: str,
+) -> BestPracticesReport:
+    """Memoized SQLBestPracticesScorer.score keyed by SQL and dialect."""
+    return scorer.score(sql, dialect=dialect)
+
+
+# Weighted dimensions in a fixed order: (weight key, score attribute, default weight)
+_DIMENSIONS = (
+    ("correctness", "correctness", 0.35),
+    ("efficiency", "efficiency", 0.15),
+    ("safety", "safety", 0.20),
+    ("result_completeness", "result_completeness", 0.10),
+    ("semantic_accuracy", "semantic_accuracy_score", 0.10),
+    ("best_practices", "best_practices_score", 0.05),
+    ("plan_quality", "plan_quality_score", 0.05),
+)
+_DIMENSION_KEYS = tuple(key for key, _, _ in _DIMENSIONS)
+_dimension_values = attrgetter(*(attr for _, attr, _ in _DIMENSIONS))
+
+
+def _weight_vector(weights: Dict[str, float]) -> Tuple[float, ...]:
+    """Flatten a weights dict into a tuple in _DIMENSIONS order."""
+    return tuple(weights.get(key, default) for key, _, default in _DIMENSIONS)
+
+
+class _ErrorAnalysis(NamedTuple):
+    """Error taxonomy result kept unserialized until it is read."""
+    score: float
+    classifications: List[ErrorClassification]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "score": self.score,
+            "errors": [c.to_dict() for c in self.classifications],
+        }
+
+
+def _lazy_report(key: str, doc: str) -> property:
+    """
+    Property exposing an analyzer report as a dict.
+
+    score() stores the analyzer's report object as-is; it is converted with
+    its to_dict() on first read and the dict memoized, so callers that only
+    need the numeric scores never pay for serializing the reports.
+    """
+    def getter(self: "EnhancedScore") -> Dict[str, Any]:
+        report = self._reports.get(key)
+        if report is None:
+            report = self._reports[key] = {}
+        elif not isinstance(report, dict):
+            report = self._reports[key] = report.to_dict()
+        return report
+
+    def setter(self: "EnhancedScore", report: Any) -> None:
+        self._reports[key] = report
+
+    return property(getter, setter, doc=doc)
+
+
+@dataclass(slots=True)
 class EnhancedScore(MultiDimensionalScore):
     """
     Extended score with additional dimensions and detailed breakdown.
@@ -65,15 +203,22 @@ class EnhancedScore(MultiDimensionalScore):
     error_severity_score: float = 0.0
 
     # Detailed reports
-    complexity_report: Dict[str, Any] = field(default_factory=dict)
     performance_thresholds: Dict[str, float] = field(default_factory=dict)
     hallucination_details: Dict[str, Any] = field(default_factory=dict)
-    plan_analysis: Dict[str, Any] = field(default_factory=dict)
-    semantic_analysis: Dict[str, Any] = field(default_factory=dict)
-    error_analysis: Dict[str, Any] = field(default_factory=dict)
-    best_practices_report: Dict[str, Any] = field(default_factory=dict)
 
-    def compute_overall(self) -> float:
+    # Analyzer reports by name, serialized lazily (see _lazy_report)
+    _reports: Dict[str, Any] = field(default_factory=dict, init=False, repr=False, compare=False)
+
+    # Weights flattened in _DIMENSIONS order; derived from weights when empty
+    weight_vector: Tuple[float, ...] = ()
+
+    complexity_report = _lazy_report("complexity", "Query complexity breakdown.")
+    plan_analysis = _lazy_report("plan", "Execution plan analysis.")
+    semantic_analysis = _lazy_report("semantic", "Value-level result comparison.")
+    error_analysis = _lazy_report("errors", "Error taxonomy classification.")
+    best_practices_report = _lazy_report("best_practices", "SQL best practices violations.")
+
+    def compute_overall(self, weight_vector: Optional[Tuple[float, ...]] = None) -> float:
         """
         Compute weighted overall score with new dimensions.
 
@@ -85,31 +230,24 @@ class EnhancedScore(MultiDimensionalScore):
             semantic_acc    × 0.10 (new)
             best_practices  × 0.05 (new)
             plan_quality    × 0.05 (new)
+
+        Args:
+            weight_vector: Weights in _DIMENSIONS order; defaults to the score's
+                own weight_vector, or one derived from its weights dict
         """
-        self.overall = (
-            self.weights.get("correctness", 0.35) * self.correctness +
-            self.weights.get("efficiency", 0.15) * self.efficiency +
-            self.weights.get("safety", 0.20) * self.safety +
-            self.weights.get("result_completeness", 0.10) * self.result_completeness +
-            self.weights.get("semantic_accuracy", 0.10) * self.semantic_accuracy_score +
-            self.weights.get("best_practices", 0.05) * self.best_practices_score +
-            self.weights.get("plan_quality", 0.05) * self.plan_quality_score
-        )
+        if weight_vector is None:
+            weight_vector = self.weight_vector or _weight_vector(self.weights)
+        self.overall = sum(map(mul, weight_vector, _dimension_values(self)))
         return self.overall
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to detailed dictionary."""
         return {
             "overall": round(self.overall, 4),
-            "dimensions": {
-                "correctness": round(self.correctness, 4),
-                "efficiency": round(self.efficiency, 4),
-                "safety": round(self.safety, 4),
-                "result_completeness": round(self.result_completeness, 4),
-                "semantic_accuracy": round(self.semantic_accuracy_score, 4),
-                "best_practices": round(self.best_practices_score, 4),
-                "plan_quality": round(self.plan_quality_score, 4),
-            },
+            "dimensions": dict(zip(
+                _DIMENSION_KEYS,
+                [round(value, 4) for value in _dimension_values(self)],
+            )),
             "sub_scores": {
                 "validation_score": round(self.validation_score, 4),
                 "performance_score": round(self.performance_score, 4),
@@ -160,6 +298,7 @@ class EnhancedScorer:
         use_adaptive_thresholds: bool = True,
         use_semantic_accuracy: bool = True,
         use_best_practices: bool = True,
+        fast_fail: bool = False,
     ):
         """
         Initialize the enhanced scorer.
@@ -169,20 +308,50 @@ class EnhancedScorer:
             use_adaptive_thresholds: Use complexity-aware performance thresholds
             use_semantic_accuracy: Enable semantic result comparison
             use_best_practices: Enable SQL best practices scoring
+            fast_fail: Skip the result analyzers for queries that failed to
+                execute without any validation errors (opt-in; semantic and
+                plan scores then take their defaults, which can change the
+                overall score of such queries)
         """
         self.weights = weights or self.DEFAULT_WEIGHTS.copy()
         self.use_adaptive_thresholds = use_adaptive_thresholds
         self.use_semantic_accuracy = use_semantic_accuracy
         self.use_best_practices = use_best_practices
-
-        # Initialize scoring components
-        self.complexity_analyzer = QueryComplexityAnalyzer()
-        self.performance_scorer = AdaptivePerformanceScorer()
-        self.hallucination_scorer = WeightedHallucinationScorer()
-        self.plan_analyzer = ExecutionPlanAnalyzer()
-        self.semantic_scorer = SemanticAccuracyScorer()
-        self.error_classifier = ErrorTaxonomyClassifier()
-        self.best_practices_scorer = SQLBestPracticesScorer()
+        self.fast_fail = fast_fail
+
+        # Initialize scoring components (the remaining ones are created
+        # lazily on first use, see the cached properties below)
+        self.complexity_analyzer = _SHARED_COMPLEXITY_ANALYZER
+        self.best_practices_scorer = _SHARED_BEST_PRACTICES_SCORER
+
+        # Adaptive thresholds by (complexity level, dialect, row estimate);
+        # row estimates up to 1000 get no adjustment and share one entry
+        self._thresholds_cache: Dict[Tuple[str, str, Optional[int]], PerformanceThresholds] = {}
+
+    @cached_property
+    def performance_scorer(self) -> AdaptivePerformanceScorer:
+        """Only built once a successful query is scored with adaptive thresholds."""
+        return AdaptivePerformanceScorer()
+
+    @cached_property
+    def hallucination_scorer(self) -> WeightedHallucinationScorer:
+        """Built on the first score() call."""
+        return WeightedHallucinationScorer()
+
+    @cached_property
+    def plan_analyzer(self) -> ExecutionPlanAnalyzer:
+        """Only built once a plan_text is scored."""
+        return ExecutionPlanAnalyzer()
+
+    @cached_property
+    def semantic_scorer(self) -> SemanticAccuracyScorer:
+        """Only built when semantic accuracy is enabled and expected rows are given."""
+        return SemanticAccuracyScorer()
+
+    @cached_property
+    def error_classifier(self) -> ErrorTaxonomyClassifier:
+        """Only built once a query with validation errors is scored."""
+        return ErrorTaxonomyClassifier()
 
     def score(
         self,
@@ -204,22 +373,34 @@ class EnhancedScorer:
             expected_results: Expected results (for semantic accuracy)
             plan_text: Execution plan text (for plan analysis)
 
+        Duplicate validation errors (e.g. the same phantom table reported
+        more than once by the driver) are counted once when scoring
+        validation, hallucinations and error severity; details keep the
+        raw list.
+
         Returns:
             EnhancedScore with detailed breakdown
         """
-        score = EnhancedScore(weights=self.weights)
+        score = EnhancedScore(
+            weights=self.weights,
+            # Flattened per call so in-place edits to self.weights apply
+            weight_vector=_weight_vector(self.weights),
+        )
+
+        if self.fast_fail and not execution_result.success and not execution_result.validation_errors:
+            return self._fast_fail_score(score, comparison, execution_result, sql, dialect)
+
+        errors = list(dict.fromkeys(execution_result.validation_errors))
 
         # 1. Analyze query complexity (if SQL provided)
         complexity_report = None
         if sql:
-            complexity_report = self.complexity_analyzer.analyze(
+            complexity_report = _cached_complexity(
+                self.complexity_analyzer,
                 sql,
-                parsed_info={
-                    "tables_accessed": execution_result.tables_accessed,
-                    "columns_accessed": execution_result.columns_accessed,
-                }
+                tuple(sorted(execution_result.tables_accessed)),
             )
-            score.complexity_report = complexity_report.to_dict()
+            score.complexity_report = complexity_report
             score.query_complexity_score = complexity_report.complexity_score
 
         # 2. Compute correctness (from comparison)
@@ -235,14 +416,7 @@ class EnhancedScorer:
         score.performance_score = score.efficiency
 
         # 4. Compute safety with weighted hallucination severity
-        score.safety, score.hallucination_details = self._compute_safety(execution_result)
-        score.validation_score = self._compute_validation_score(execution_result)
-
-        # Extract hallucination score from details
-        if "final_score" in score.hallucination_details:
-            score.hallucination_score = score.hallucination_details["final_score"]
-        else:
-            score.hallucination_score = self._legacy_hallucination_score(execution_result)
+        self._apply_safety(score, execution_result, errors)
 
         # 5. Compute result completeness
         score.result_completeness = self._compute_completeness(execution_result)
@@ -254,7 +428,7 @@ class EnhancedScorer:
                 expected_results,
             )
             score.semantic_accuracy_score = semantic_result.overall_score
-            score.semantic_analysis = semantic_result.to_dict()
+            score.semantic_analysis = semantic_result
         else:
             # Fall back to comparison match score
             score.semantic_accuracy_score = comparison.match_score
@@ -263,28 +437,23 @@ class EnhancedScorer:
         if plan_text:
             plan_result = self.plan_analyzer.analyze(plan_text, dialect)
             score.plan_quality_score = plan_result.plan_score
-            score.plan_analysis = plan_result.to_dict()
+            score.plan_analysis = plan_result
         else:
             score.plan_quality_score = 1.0  # Assume optimal if no plan
 
         # 8. Compute error severity score
-        if execution_result.validation_errors:
-            error_score, classifications = self.error_classifier.score_errors(
-                execution_result.validation_errors
-            )
+        if errors:
+            error_score, classifications = self.error_classifier.score_errors(errors)
             score.error_severity_score = error_score
-            score.error_analysis = {
-                "score": error_score,
-                "errors": [c.to_dict() for c in classifications],
-            }
+            score.error_analysis = _ErrorAnalysis(error_score, classifications)
         else:
             score.error_severity_score = 1.0
 
         # 9. Compute best practices score (if SQL provided)
         if self.use_best_practices and sql:
-            bp_report = self.best_practices_scorer.score(sql)
+            bp_report = _cached_best_practices(self.best_practices_scorer, sql, dialect)
             score.best_practices_score = bp_report.score
-            score.best_practices_report = bp_report.to_dict()
+            score.best_practices_report = bp_report
         else:
             score.best_practices_score = 1.0
 
@@ -296,6 +465,98 @@ class EnhancedScorer:
 
         return score
 
+    def _fast_fail_score(
+        self,
+        score: EnhancedScore,
+        comparison: ComparisonResult,
+        execution_result: ExecutionResult,
+        sql: Optional[str],
+        dialect: str,
+    ) -> EnhancedScore:
+        """
+        Score a query that failed to execute without validation errors.
+
+        Efficiency and completeness are zero for a failed query anyway.
+        Complexity and best practices come from the same per-SQL caches as
+        score(); the result analyzers are skipped and their dimensions get
+        the defaults score() uses when they are disabled.
+        """
+        if sql:
+            complexity_report = _cached_complexity(
+                self.complexity_analyzer,
+                sql,
+                tuple(sorted(execution_result.tables_accessed)),
+            )
+            score.complexity_report = complexity_report
+            score.query_complexity_score = complexity_report.complexity_score
+
+        score.correctness = self._compute_correctness(comparison)
+        self._apply_safety(score, execution_result, [])
+        score.semantic_accuracy_score = comparison.match_score
+        score.plan_quality_score = 1.0
+        score.error_severity_score = 1.0
+        if self.use_best_practices and sql:
+            bp_report = _cached_best_practices(self.best_practices_scorer, sql, dialect)
+            score.best_practices_score = bp_report.score
+            score.best_practices_report = bp_report
+        else:
+            score.best_practices_score = 1.0
+
+        score.compute_overall()
+        score.details = self._build_details(comparison, execution_result)
+
+        return score
+
+    def score_many(
+        self,
+        comparisons: Sequence[ComparisonResult],
+        execution_results: Sequence[ExecutionResult],
+        sqls: Optional[Sequence[Optional[str]]] = None,
+        dialect: str = "sqlite",
+        expected_results: Optional[Sequence[Optional[List[Dict[str, Any]]]]] = None,
+        plan_texts: Optional[Sequence[Optional[str]]] = None,
+    ) -> List[EnhancedScore]:
+        """
+        Score a batch of queries.
+
+        Complexity and best-practices analysis run once per unique SQL string
+        in the batch (and are shared with earlier score() calls through the
+        module-level cache), so repeated queries only pay for the result-level
+        dimensions.
+
+        Args:
+            comparisons: One comparison result per query
+            execution_results: One execution result per query
+            sqls: Optional SQL text per query
+            dialect: Database dialect shared by the batch
+            expected_results: Optional expected rows per query
+            plan_texts: Optional execution plan text per query
+
+        Returns:
+            List of EnhancedScore in input order
+        """
+        count = len(comparisons)
+        for name, values in (
+            ("execution_results", execution_results),
+            ("sqls", sqls),
+            ("expected_results", expected_results),
+            ("plan_texts", plan_texts),
+        ):
+            if values is not None and len(values) != count:
+                raise ValueError(f"{name} has {len(values)} items, expected {count}")
+
+        return [
+            self.score(
+                comparisons[i],
+                execution_results[i],
+                sql=sqls[i] if sqls is not None else None,
+                dialect=dialect,
+                expected_results=expected_results[i] if expected_results is not None else None,
+                plan_text=plan_texts[i] if plan_texts is not None else None,
+            )
+            for i in range(count)
+        ]
+
     def _compute_correctness(self, comparison: ComparisonResult) -> float:
         """Compute correctness from comparison result."""
         if comparison.is_match:
@@ -318,10 +579,10 @@ class EnhancedScorer:
             return 0.0, {}
 
         if self.use_adaptive_thresholds:
-            thresholds = self.performance_scorer.get_thresholds(
-                complexity_level=complexity_level,
-                dialect=dialect,
-                row_estimate=execution_result.rows_returned,
+            thresholds = self._get_thresholds(
+                complexity_level,
+                dialect,
+                execution_result.rows_returned,
             )
             score = self.performance_scorer.score(
                 execution_result.execution_time_ms,
@@ -331,43 +592,78 @@ class EnhancedScorer:
         else:
             # Legacy fixed thresholds
             time_ms = execution_result.execution_time_ms
-            if time_ms <= 10:
-                return 1.0, {"excellent": 10, "good": 100, "acceptable": 1000}
-            elif time_ms <= 100:
-                ratio = (time_ms - 10) / 90
-                return 1.0 - (0.2 * ratio), {"excellent": 10, "good": 100, "acceptable": 1000}
-            elif time_ms <= 1000:
-                ratio = (time_ms - 100) / 900
-                return 0.8 - (0.3 * ratio), {"excellent": 10, "good": 100, "acceptable": 1000}
-            else:
-                return max(0.0, 0.5 - ((time_ms - 1000) / 10000)), {"excellent": 10, "good": 100, "acceptable": 1000}
+            return _legacy_efficiency(time_ms), dict(_LEGACY_THRESHOLDS)
+
+    def _get_thresholds(
+        self,
+        complexity_level: str,
+        dialect: str,
+        row_estimate: Optional[int],
+    ) -> PerformanceThresholds:
+        """Memoized performance_scorer.get_thresholds (result is shared, read-only)."""
+        key = (
+            complexity_level,
+            dialect,
+            row_estimate if row_estimate is not None and row_estimate > 1000 else None,
+        )
+        thresholds = self._thresholds_cache.get(key)
+        if thresholds is None:
+            if len(self._thresholds_cache) >= 1024:
+                self._thresholds_cache.clear()
+            thresholds = self._thresholds_cache[key] = self.performance_scorer.get_thresholds(
+                complexity_level=complexity_level,
+                dialect=dialect,
+                row_estimate=row_estimate,
+            )
+        return thresholds
+
+    def _apply_safety(
+        self,
+        score: EnhancedScore,
+        execution_result: ExecutionResult,
+        errors: List[str],
+    ) -> None:
+        """Fill the safety, validation and hallucination scores."""
+        score.safety, score.hallucination_details = self._compute_safety(execution_result, errors)
+        score.validation_score = self._compute_validation_score(execution_result, errors)
+
+        # Extract hallucination score from details
+        if "final_score" in score.hallucination_details:
+            score.hallucination_score = score.hallucination_details["final_score"]
+        else:
+            score.hallucination_score = self._legacy_hallucination_score(execution_result, errors)
 
     def _compute_safety(
         self,
         execution_result: ExecutionResult,
+        errors: List[str],
     ) -> tuple:
         """
         Compute safety with weighted hallucination severity.
 
+        Args:
+            execution_result: Execution result (for the validation score)
+            errors: Deduplicated validation errors to score and classify
+
         Returns:
             Tuple of (score, hallucination_details)
         """
-        validation_score = self._compute_validation_score(execution_result)
+        validation_score = self._compute_validation_score(execution_result, errors)
 
         # Extract hallucination info from validation errors
         phantom_tables = []
         phantom_columns = []
         phantom_functions = []
 
-        for error in execution_result.validation_errors:
-            error_lower = error.lower()
-            if "table" in error_lower and ("not exist" in error_lower or "does not exist" in error_lower):
-                # Extract table name
-                phantom_tables.append(error)
-            elif "column" in error_lower and ("not exist" in error_lower or "does not exist" in error_lower):
-                phantom_columns.append(error)
-            elif "function" in error_lower and ("not exist" in error_lower or "invalid" in error_lower):
-                phantom_functions.append(error)
+        buckets = {
+            "table": phantom_tables,
+            "column": phantom_columns,
+            "function": phantom_functions,
+        }
+        for error in errors:
+            match = _HALLUCINATION_RE.match(error)
+            if match:
+                buckets[match.lastgroup].append(error)
 
         # Use weighted scorer
         hallucination_score, details = self.hallucination_scorer.score(
@@ -381,15 +677,19 @@ class EnhancedScorer:
 
         return safety_score, details
 
-    def _compute_validation_score(self, execution_result: ExecutionResult) -> float:
-        """Compute validation score based on query validity."""
+    def _compute_validation_score(
+        self,
+        execution_result: ExecutionResult,
+        errors: List[str],
+    ) -> float:
+        """Compute validation score from query validity and deduplicated errors."""
         if execution_result.is_valid:
             score = 1.0
             warning_count = len(execution_result.validation_warnings)
             score -= warning_count * 0.1
             return max(0.0, score)
         else:
-            error_count = len(execution_result.validation_errors)
+            error_count = len(errors)
             if error_count == 0:
                 return 0.5
             elif error_count == 1:
@@ -397,25 +697,19 @@ class EnhancedScorer:
             else:
                 return 0.1
 
-    def _legacy_hallucination_score(self, execution_result: ExecutionResult) -> float:
-        """Legacy keyword-based hallucination scoring."""
-        if execution_result.is_valid and not execution_result.validation_errors:
+    def _legacy_hallucination_score(
+        self,
+        execution_result: ExecutionResult,
+        errors: List[str],
+    ) -> float:
+        """Legacy keyword-based hallucination scoring over deduplicated errors."""
+        if execution_result.is_valid and not errors:
             return 1.0
 
-        hallucination_keywords = [
-            "does not exist",
-            "unknown column",
-            "unknown table",
-            "invalid",
-            "not found",
-            "no such",
-        ]
-
-        hallucination_count = 0
-        for error in execution_result.validation_errors:
-            error_lower = error.lower()
-            if any(keyword in error_lower for keyword in hallucination_keywords):
-                hallucination_count += 1
+        hallucination_count = sum(
+            1 for error in errors
+            if _HALLUCINATION_KEYWORDS_RE.search(error)
+        )
 
         if hallucination_count == 0:
             return 1.0
@@ -432,15 +726,9 @@ class EnhancedScorer:
         score = 1.0
 
         for insight in execution_result.insights:
-            insight_lower = insight.lower()
-            if "no results" in insight_lower or "empty" in insight_lower:
-                score -= 0.2
-            elif "truncated" in insight_lower:
-                score -= 0.1
-            elif "null" in insight_lower:
-                score -= 0.05
-            elif "slow" in insight_lower or "long" in insight_lower:
-                score -= 0.1
+            match = _INSIGHT_RE.match(insight)
+            if match:
+                score -= _INSIGHT_PENALTIES[match.lastgroup]
 
         # Bonus for having results
         if execution_result.rows_returned > 0:
@@ -486,6 +774,47 @@ class EnhancedScorer:
 # CONVENIENCE FUNCTIONS
 # =============================================================================
 
+# Weight presets for create_enhanced_scorer, built once and copied per scorer
+_PRESET_WEIGHTS = MappingProxyType({
+    "default": MappingProxyType({
+        "correctness": 0.35,
+        "efficiency": 0.15,
+        "safety": 0.20,
+        "result_completeness": 0.10,
+        "semantic_accuracy": 0.10,
+        "best_practices": 0.05,
+        "plan_quality": 0.05,
+    }),
+    "strict": MappingProxyType({
+        "correctness": 0.40,
+        "efficiency": 0.10,
+        "safety": 0.25,
+        "result_completeness": 0.10,
+        "semantic_accuracy": 0.10,
+        "best_practices": 0.025,
+        "plan_quality": 0.025,
+    }),
+    "performance": MappingProxyType({
+        "correctness": 0.30,
+        "efficiency": 0.25,
+        "safety": 0.15,
+        "result_completeness": 0.10,
+        "semantic_accuracy": 0.05,
+        "best_practices": 0.05,
+        "plan_quality": 0.10,
+    }),
+    "quality": MappingProxyType({
+        "correctness": 0.30,
+        "efficiency": 0.10,
+        "safety": 0.20,
+        "result_completeness": 0.10,
+        "semantic_accuracy": 0.10,
+        "best_practices": 0.15,
+        "plan_quality": 0.05,
+    }),
+})
+
+
 def create_enhanced_scorer(
     preset: str = "default",
     **kwargs,
@@ -506,54 +835,7 @@ def create_enhanced_scorer(
     Returns:
         Configured EnhancedScorer
     """
-    presets = {
-        "default": {
-            "weights": {
-                "correctness": 0.35,
-                "efficiency": 0.15,
-                "safety": 0.20,
-                "result_completeness": 0.10,
-                "semantic_accuracy": 0.10,
-                "best_practices": 0.05,
-                "plan_quality": 0.05,
-            }
-        },
-        "strict": {
-            "weights": {
-                "correctness": 0.40,
-                "efficiency": 0.10,
-                "safety": 0.25,
-                "result_completeness": 0.10,
-                "semantic_accuracy": 0.10,
-                "best_practices": 0.025,
-                "plan_quality": 0.025,
-            }
-        },
-        "performance": {
-            "weights": {
-                "correctness": 0.30,
-                "efficiency": 0.25,
-                "safety": 0.15,
-                "result_completeness": 0.10,
-                "semantic_accuracy": 0.05,
-                "best_practices": 0.05,
-                "plan_quality": 0.10,
-            }
-        },
-        "quality": {
-            "weights": {
-                "correctness": 0.30,
-                "efficiency": 0.10,
-                "safety": 0.20,
-                "result_completeness": 0.10,
-                "semantic_accuracy": 0.10,
-                "best_practices": 0.15,
-                "plan_quality": 0.05,
-            }
-        },
-    }
-
-    config = presets.get(preset, presets["default"]).copy()
+    config = {"weights": dict(_PRESET_WEIGHTS.get(preset, _PRESET_WEIGHTS["default"]))}
     config.update(kwargs)
 
     return EnhancedScorer(**config)
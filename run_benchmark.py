@@ -23,12 +23,20 @@ import json
 import csv
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
+from operator import attrgetter
 from dataclasses import dataclass, field, asdict
 from typing import Any, Dict, List, Optional, Callable
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional: faster JSON export when installed
+    orjson = None
+
 # Add paths
 sys.path.insert(0, os.path.dirname(__file__))
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
@@ -47,6 +55,7 @@ class BenchmarkConfig:
     timeout: float = 30.0
     verbose: bool = False
     schema: str = "basic"  # "basic" or "enterprise"
+    workers: int = 1  # > 1 calls sql_generator from several threads at once
 
 
 @dataclass
@@ -212,116 +221,58 @@ class BenchmarkRunner:
         from agentx import SQLExecutor, ExecutorConfig
         from evaluation.enhanced_scorer import EnhancedScorer
         from evaluation.result_comparator import DefaultResultComparator
-        from evaluation.data_structures import ComparisonResult, ExecutionResult
 
-        executor = SQLExecutor(ExecutorConfig(dialect=self.config.dialect))
-        scorer = EnhancedScorer()
         comparator = DefaultResultComparator()
 
-        # Setup sample data
-        self._setup_sample_data(executor)
-
         self.results = []
 
-        for i, task in enumerate(self.tasks, 1):
-            task_id = task["id"]
-            difficulty = task.get("difficulty", "medium")
-
-            print(f"[{i}/{len(self.tasks)}] {task_id} ({difficulty})...", end=" ", flush=True)
-
-            result = TaskResult(
-                task_id=task_id,
-                question=task["question"],
-                difficulty=difficulty,
-                tags=task.get("tags", []),
-                gold_sql=task["gold_sql"],
-            )
+        # Read-only queries are executed at most once per exact SQL text and
+        # database; repeated submissions reuse the first run's result until a
+        # statement that may modify the data runs. The text is not
+        # normalized: result column names follow the query's spelling.
 
-            try:
-                # Get SQL to evaluate
-                if sql_generator:
-                    sql = sql_generator(task)
-                    result.agent_sql = sql
-                else:
-                    sql = task["gold_sql"]
-                    result.agent_sql = sql
+        total = len(self.tasks)
+        workers = self._worker_count()
 
-                # Execute and evaluate
-                exec_result = executor.process_query(sql, verbose=False)
+        if workers > 1:
+            # Connections are bound to the thread that opened them, so each
+            # worker evaluates against its own executor and sample data
+            local = threading.local()
 
-                result.is_valid = exec_result.is_valid
-                result.validation_errors = exec_result.validation.get("errors", [])
-
-                hall_report = exec_result.validation.get("hallucination_report", {})
-                if hall_report:
-                    result.phantom_tables = hall_report.get("phantom_tables", [])
-                    result.phantom_columns = hall_report.get("phantom_columns", [])
-
-                if exec_result.success:
-                    result.status = "success"
-                    result.rows_returned = len(exec_result.data) if exec_result.data else 0
-                    result.execution_time_ms = exec_result.execution.get("execution_time_ms", 0)
-
-                    # Compare with expected results if available
-                    expected = task.get("expected_results")
-                    if expected:
-                        comparison = comparator.compare(exec_result.data, expected)
-                        result.matches_expected = comparison.is_match
-                        result.match_score = comparison.match_score
-                    else:
-                        comparison = ComparisonResult(
-                            is_match=True, match_score=1.0,
-                            row_count_match=True, column_count_match=True
-                        )
-
-                    # Create execution result for scorer
-                    eval_exec_result = ExecutionResult(
-                        success=True,
-                        data=exec_result.data,
-                        rows_returned=result.rows_returned,
-                        execution_time_ms=result.execution_time_ms,
-                        is_valid=result.is_valid,
-                        validation_errors=result.validation_errors,
-                        query_type=exec_result.validation.get("query_type", "SELECT"),
-                        tables_accessed=exec_result.validation.get("tables_accessed", []),
-                        columns_accessed=exec_result.validation.get("columns_accessed", []),
-                    )
+            def init_worker():
+                local.executor = SQLExecutor(ExecutorConfig(dialect=self.config.dialect))
+                local.scorer = EnhancedScorer()
+                local.executed = {}
+                self._setup_sample_data(local.executor)
 
-                    # Score
-                    score = scorer.score(
-                        comparison=comparison,
-                        execution_result=eval_exec_result,
-                        sql=sql,
-                        dialect=self.config.dialect,
-                        expected_results=expected,
-                    )
+            def run_task(task: Dict) -> TaskResult:
+                return self._run_task(
+                    task, sql_generator, local.executor, local.scorer, comparator, local.executed
+                )
 
-                    result.overall_score = score.overall
-                    result.correctness = score.correctness
-                    result.efficiency = score.efficiency
-                    result.safety = score.safety
-                    result.completeness = score.result_completeness
-                    result.semantic_accuracy = score.semantic_accuracy_score
-                    result.best_practices = score.best_practices_score
-                    result.plan_quality = score.plan_quality_score
+            with ThreadPoolExecutor(max_workers=workers, initializer=init_worker) as pool:
+                results = pool.map(run_task, self.tasks)
+                for i, (task, result) in enumerate(zip(self.tasks, results), 1):
+                    print(f"[{i}/{total}] {task['id']} ({result.difficulty})... {self._status_text(result)}")
+                    self.results.append(result)
+        else:
+            executor = SQLExecutor(ExecutorConfig(dialect=self.config.dialect))
+            scorer = EnhancedScorer()
+            executed: Dict[str, Any] = {}
 
-                    if score.best_practices_report:
-                        result.suggestions = score.best_practices_report.get("suggestions", [])
+            # Setup sample data
+            self._setup_sample_data(executor)
 
-                    print(f"✓ {result.overall_score:.1%}")
-                else:
-                    result.status = "failed"
-                    result.error_message = exec_result.error
-                    print(f"✗ FAILED")
+            for i, task in enumerate(self.tasks, 1):
+                difficulty = task.get("difficulty", "medium")
+                print(f"[{i}/{total}] {task['id']} ({difficulty})...", end=" ", flush=True)
 
-            except Exception as e:
-                result.status = "error"
-                result.error_message = str(e)
-                print(f"✗ ERROR: {e}")
+                result = self._run_task(task, sql_generator, executor, scorer, comparator, executed)
+                print(self._status_text(result))
 
-            self.results.append(result)
+                self.results.append(result)
 
-        executor.close()
+            executor.close()
 
         completed_at = datetime.now(timezone.utc)
         duration = (completed_at - started_at).total_seconds()
@@ -336,6 +287,136 @@ class BenchmarkRunner:
 
         return report
 
+    def _run_task(
+        self,
+        task: Dict,
+        sql_generator: Optional[Callable[[Dict], str]],
+        executor,
+        scorer,
+        comparator,
+        executed: Dict[str, Any],
+    ) -> TaskResult:
+        """Generate, execute and score the SQL for a single task."""
+        from evaluation.data_structures import ComparisonResult, ExecutionResult
+
+        task_id = task["id"]
+        difficulty = task.get("difficulty", "medium")
+
+        result = TaskResult(
+            task_id=task_id,
+            question=task["question"],
+            difficulty=difficulty,
+            tags=task.get("tags", []),
+            gold_sql=task["gold_sql"],
+        )
+
+        try:
+            # Get SQL to evaluate
+            if sql_generator:
+                sql = sql_generator(task)
+                result.agent_sql = sql
+            else:
+                sql = task["gold_sql"]
+                result.agent_sql = sql
+
+            # Execute and evaluate
+            key = sql if executor.is_read_only(sql) else None
+            exec_result = executed.get(key) if key is not None else None
+            if exec_result is None:
+                exec_result = executor.process_query(sql, verbose=False)
+                if key is not None:
+                    executed[key] = exec_result
+                else:
+                    # The statement may have changed the data cached
+                    # results were read from
+                    executed.clear()
+
+            result.is_valid = exec_result.is_valid
+            result.validation_errors = list(exec_result.validation.get("errors", []))
+
+            hall_report = exec_result.validation.get("hallucination_report", {})
+            if hall_report:
+                result.phantom_tables = list(hall_report.get("phantom_tables", []))
+                result.phantom_columns = list(hall_report.get("phantom_columns", []))
+
+            if exec_result.success:
+                result.status = "success"
+                result.rows_returned = len(exec_result.data) if exec_result.data else 0
+                result.execution_time_ms = exec_result.execution.get("execution_time_ms", 0)
+
+                # Compare with expected results if available
+                expected = task.get("expected_results")
+                if expected:
+                    comparison = comparator.compare(exec_result.data, expected)
+                    result.matches_expected = comparison.is_match
+                    result.match_score = comparison.match_score
+                else:
+                    comparison = ComparisonResult(
+                        is_match=True, match_score=1.0,
+                        row_count_match=True, column_count_match=True
+                    )
+
+                # Create execution result for scorer
+                eval_exec_result = ExecutionResult(
+                    success=True,
+                    data=exec_result.data,
+                    rows_returned=result.rows_returned,
+                    execution_time_ms=result.execution_time_ms,
+                    is_valid=result.is_valid,
+                    validation_errors=result.validation_errors,
+                    query_type=exec_result.validation.get("query_type", "SELECT"),
+                    tables_accessed=exec_result.validation.get("tables_accessed", []),
+                    columns_accessed=exec_result.validation.get("columns_accessed", []),
+                )
+
+                # Score
+                score = scorer.score(
+                    comparison=comparison,
+                    execution_result=eval_exec_result,
+                    sql=sql,
+                    dialect=self.config.dialect,
+                    expected_results=expected,
+                )
+
+                result.overall_score = score.overall
+                result.correctness = score.correctness
+                result.efficiency = score.efficiency
+                result.safety = score.safety
+                result.completeness = score.result_completeness
+                result.semantic_accuracy = score.semantic_accuracy_score
+                result.best_practices = score.best_practices_score
+                result.plan_quality = score.plan_quality_score
+
+                if score.best_practices_report:
+                    result.suggestions = score.best_practices_report.get("suggestions", [])
+            else:
+                result.status = "failed"
+                result.error_message = exec_result.error
+
+        except Exception as e:
+            result.status = "error"
+            result.error_message = str(e)
+
+        return result
+
+    @staticmethod
+    def _status_text(result: TaskResult) -> str:
+        """Progress line suffix for a finished task."""
+        if result.status == "success":
+            return f"✓ {result.overall_score:.1%}"
+        if result.status == "failed":
+            return "✗ FAILED"
+        return f"✗ ERROR: {result.error_message}"
+
+    def _worker_count(self) -> int:
+        """
+        Threads to evaluate tasks with.
+
+        Serial unless configured: a sql_generator (typically a rate-limited
+        agent client) is only called concurrently when explicitly asked for.
+        """
+        return max(1, min(self.config.workers, len(self.tasks)))
+
     def _setup_sample_data(self, executor):
         """Setup sample data for evaluation."""
         if self.config.schema == "enterprise":
@@ -418,10 +499,15 @@ class BenchmarkRunner:
     ) -> BenchmarkReport:
         """Build comprehensive benchmark report."""
 
-        successful = [r for r in self.results if r.status == "success"]
-        failed = [r for r in self.results if r.status == "failed"]
-        errors = [r for r in self.results if r.status == "error"]
-        skipped = [r for r in self.results if r.status == "skipped"]
+        # Bucket results by status in one pass
+        by_status: Dict[str, List[TaskResult]] = {
+            "success": [], "failed": [], "error": [], "skipped": [],
+        }
+        for r in self.results:
+            bucket = by_status.get(r.status)
+            if bucket is not None:
+                bucket.append(r)
+        successful = by_status["success"]
 
         # Calculate aggregate scores
         scores = [r.overall_score for r in successful]
@@ -429,44 +515,53 @@ class BenchmarkRunner:
 
         sorted_scores = sorted(scores)
         median_score = sorted_scores[len(sorted_scores) // 2] if sorted_scores else 0.0
-        min_score = min(scores) if scores else 0.0
-        max_score = max(scores) if scores else 0.0
+        min_score = sorted_scores[0] if sorted_scores else 0.0
+        max_score = sorted_scores[-1] if sorted_scores else 0.0
 
-        # Scores by dimension
+        # Sum dimension scores and group successful scores by difficulty
+        # and tag in one pass
         dimensions = ["correctness", "efficiency", "safety", "completeness",
                       "semantic_accuracy", "best_practices", "plan_quality"]
-        scores_by_dimension = {}
-        for dim in dimensions:
-            dim_scores = [getattr(r, dim) for r in successful]
-            scores_by_dimension[dim] = sum(dim_scores) / len(dim_scores) if dim_scores else 0.0
+        get_dimensions = attrgetter(*dimensions)
+        dimension_sums = [0.0] * len(dimensions)
+        difficulty_scores: Dict[str, List[float]] = {
+            "easy": [], "medium": [], "hard": [], "enterprise": [],
+        }
+        tag_scores: Dict[str, List[float]] = {}
+        for r in successful:
+            for i, value in enumerate(get_dimensions(r)):
+                dimension_sums[i] += value
+            if r.difficulty in difficulty_scores:
+                difficulty_scores[r.difficulty].append(r.overall_score)
+            for tag in set(r.tags):
+                tag_scores.setdefault(tag, []).append(r.overall_score)
+
+        # Scores by dimension
+        scores_by_dimension = {
+            dim: total / len(successful) if successful else 0.0
+            for dim, total in zip(dimensions, dimension_sums)
+        }
 
         # Scores by difficulty
-        scores_by_difficulty = {}
-        for diff in ["easy", "medium", "hard", "enterprise"]:
-            diff_results = [r for r in successful if r.difficulty == diff]
-            if diff_results:
-                diff_scores = [r.overall_score for r in diff_results]
-                scores_by_difficulty[diff] = {
-                    "count": len(diff_results),
-                    "average": sum(diff_scores) / len(diff_scores),
-                    "min": min(diff_scores),
-                    "max": max(diff_scores),
-                }
+        scores_by_difficulty = {
+            diff: {
+                "count": len(diff_scores),
+                "average": sum(diff_scores) / len(diff_scores),
+                "min": min(diff_scores),
+                "max": max(diff_scores),
+            }
+            for diff, diff_scores in difficulty_scores.items()
+            if diff_scores
+        }
 
         # Scores by tag
-        scores_by_tag = {}
-        all_tags = set()
-        for r in self.results:
-            all_tags.update(r.tags)
-
-        for tag in all_tags:
-            tag_results = [r for r in successful if tag in r.tags]
-            if tag_results:
-                tag_scores = [r.overall_score for r in tag_results]
-                scores_by_tag[tag] = {
-                    "count": len(tag_results),
-                    "average": sum(tag_scores) / len(tag_scores),
-                }
+        scores_by_tag = {
+            tag: {
+                "count": len(scores_for_tag),
+                "average": sum(scores_for_tag) / len(scores_for_tag),
+            }
+            for tag, scores_for_tag in tag_scores.items()
+        }
 
         return BenchmarkReport(
             benchmark_id=benchmark_id,
@@ -476,9 +571,9 @@ class BenchmarkRunner:
             config=asdict(self.config),
             total_tasks=len(self.results),
             successful=len(successful),
-            failed=len(failed),
-            errors=len(errors),
-            skipped=len(skipped),
+            failed=len(by_status["failed"]),
+            errors=len(by_status["error"]),
+            skipped=len(by_status["skipped"]),
             average_score=avg_score,
             median_score=median_score,
             min_score=min_score,
@@ -521,8 +616,23 @@ class MetricsExporter:
         """Export full report as JSON."""
         path = self.output_dir / f"benchmark_{report.benchmark_id}.json"
 
-        with open(path, 'w') as f:
-            json.dump(report.to_dict(), f, indent=2, default=str)
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(
+                    report.to_dict(),
+                    default=str,
+                    # Passthrough keeps datetimes and dataclasses on default=str,
+                    # matching the json fallback byte for byte
+                    option=(
+                        orjson.OPT_INDENT_2
+                        | orjson.OPT_NON_STR_KEYS
+                        | orjson.OPT_PASSTHROUGH_DATETIME
+                        | orjson.OPT_PASSTHROUGH_DATACLASS
+                    ),
+                ))
+        else:
+            with open(path, 'w') as f:
+                json.dump(report.to_dict(), f, indent=2, default=str)
 
         return str(path)
 
@@ -799,6 +909,8 @@ Examples:
     parser.add_argument("--dialect", default="sqlite", help="SQL dialect")
     parser.add_argument("--schema", "-s", default="basic", choices=["basic", "enterprise"],
                         help="Schema type: basic (simple tables) or enterprise (star schema)")
+    parser.add_argument("--workers", "-w", type=int, default=1,
+                        help="Threads used to evaluate tasks; the agent must handle concurrent requests (default: 1)")
     parser.add_argument("--verbose", "-v", action="store_true", help="Verbose output")
 
     args = parser.parse_args()
@@ -813,6 +925,7 @@ Examples:
         dialect=args.dialect,
         verbose=args.verbose,
         schema=args.schema,
+        workers=args.workers,
     )
 
     # Run benchmark
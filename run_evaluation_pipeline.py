@@ -15,26 +15,58 @@ Usage:
 
     # With expected results
     python run_evaluation_pipeline.py --file query.sql --expected expected_results.json
+
+    # Script with several statements (each is evaluated separately)
+    python run_evaluation_pipeline.py --file queries.sql
+
+    # Print only the final summary, without per-step progress
+    python run_evaluation_pipeline.py "SELECT * FROM users" --quiet
 """
 
+from __future__ import annotations
+
 import argparse
+import atexit
+import copy
 import json
 import sys
 import os
+import threading
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # optional: faster JSON output when installed
+    orjson = None
 
 # Add src to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
-from typing import Dict, Any, List, Optional
+from typing import TYPE_CHECKING, Deque, Dict, Any, Iterator, List, Optional, Sequence
+
+# sqlglot, agentx and the evaluation package are imported where they are
+# used, so --help and argument errors do not pay for loading them
+if TYPE_CHECKING:
+    from agentx import SQLExecutor
+    from evaluation.data_structures import ComparisonResult, ExecutionResult
+    from evaluation.result_comparator import DefaultResultComparator
+    from evaluation.scorer import DefaultScorer
+
+
+# Both are stateless after construction, so one instance serves every
+# pipeline run (including concurrent ones)
+@lru_cache(maxsize=None)
+def _comparator() -> DefaultResultComparator:
+    from evaluation.result_comparator import DefaultResultComparator
+    return DefaultResultComparator()
 
-from agentx import SQLExecutor, ExecutorConfig
-from evaluation.data_structures import (
-    AgentResult,
-    ExecutionResult,
-    ComparisonResult,
-)
-from evaluation.result_comparator import DefaultResultComparator
-from evaluation.scorer import DefaultScorer
+
+@lru_cache(maxsize=None)
+def _scorer() -> DefaultScorer:
+    from evaluation.scorer import DefaultScorer
+    return DefaultScorer()
 
 
 def load_sql_from_file(filepath: str) -> str:
@@ -43,12 +75,60 @@ def load_sql_from_file(filepath: str) -> str:
         return f.read().strip()
 
 
+def iter_sql_statements(text: str, dialect: str = "sqlite") -> Iterator[str]:
+    """
+    Yield the individual statements of a SQL script, one at a time.
+
+    Statements are split at semicolon tokens from the sqlglot tokenizer, so
+    semicolons inside string literals or comments are left alone and no
+    statement is parsed until it is evaluated. Text that cannot be
+    tokenized is yielded whole.
+    """
+    from sqlglot.dialects.dialect import Dialect as SqlglotDialect
+    from sqlglot.errors import TokenError
+    from sqlglot.tokens import TokenType
+
+    from agentx import get_dialect_config
+
+    try:
+        tokens = SqlglotDialect.get_or_raise(
+            get_dialect_config(dialect).sqlglot_dialect
+        ).tokenize(text)
+    except (TokenError, ValueError):
+        if text.strip():
+            yield text.strip()
+        return
+
+    start = 0
+    for token in tokens:
+        if token.token_type == TokenType.SEMICOLON:
+            statement = text[start:token.start].strip()
+            if statement:
+                yield statement
+            start = token.end + 1
+
+    statement = text[start:].strip()
+    if statement:
+        yield statement
+
+
 def load_expected_results(filepath: str) -> List[Dict[str, Any]]:
     """Load expected results from a JSON file."""
+    if orjson is not None:
+        with open(filepath, 'rb') as f:
+            try:
+                return orjson.loads(f.read())
+            except orjson.JSONDecodeError:
+                # e.g. NaN/Infinity literals, which json accepts
+                pass
     with open(filepath, 'r') as f:
         return json.load(f)
 
 
+def _silent(*args: Any, **kwargs: Any) -> None:
+    """Drop progress output for non-verbose pipeline runs."""
+
+
 def create_executor(
     dialect: str,
     db_path: Optional[str] = None,
@@ -65,6 +145,8 @@ def create_executor(
     Returns:
         Configured SQLExecutor
     """
+    from agentx import SQLExecutor, ExecutorConfig
+
     config = ExecutorConfig(
         dialect=dialect,
         db_path=db_path,
@@ -73,29 +155,106 @@ def create_executor(
     return SQLExecutor(config)
 
 
+# Executors (and their connections) are reused across pipeline runs. The
+# cache is per thread because a connection must not be used by two threads
+# at once; bumping the generation makes every thread reconnect on its next
+# run. Every executor is also listed in _open_executors so that
+# clear_executor_cache can close those owned by pool threads.
+_executor_local = threading.local()
+_executor_generation = 0
+_executor_lock = threading.Lock()
+_open_executors: List[SQLExecutor] = []
+
+# Bumped after a statement that may change the schema runs, so executors
+# re-read it on their next use instead of on every call
+_schema_generation = 0
+
+
+def get_executor(
+    dialect: str,
+    db_path: Optional[str] = None,
+    connection_string: Optional[str] = None,
+) -> SQLExecutor:
+    """
+    Return this thread's executor for a database, creating it on first use.
+
+    A reused executor re-reads the schema only if a statement that is not
+    read-only has run since its last use; call clear_executor_cache after
+    changing the database from elsewhere.
+    """
+    cache = getattr(_executor_local, "cache", None)
+    if cache is None or _executor_local.generation != _executor_generation:
+        cache = _executor_local.cache = {}
+        _executor_local.schema_generations = {}
+        _executor_local.generation = _executor_generation
+
+    key = (dialect, db_path, connection_string)
+    schema_generation = _schema_generation
+    executor = cache.get(key)
+    if executor is None:
+        executor = cache[key] = create_executor(dialect, db_path, connection_string)
+        with _executor_lock:
+            _open_executors.append(executor)
+    elif _executor_local.schema_generations[key] != schema_generation:
+        executor.refresh_schema()
+    _executor_local.schema_generations[key] = schema_generation
+    return executor
+
+
+def clear_executor_cache() -> None:
+    """Close every thread's cached executors; threads reconnect on next use."""
+    global _executor_generation
+    with _executor_lock:
+        _executor_generation += 1
+        executors = _open_executors[:]
+        _open_executors.clear()
+    for executor in executors:
+        executor.close()
+    cache = getattr(_executor_local, "cache", None)
+    if cache:
+        cache.clear()
+
+
+def _schema_may_have_changed() -> None:
+    """Make every cached executor re-read the schema on its next use."""
+    global _schema_generation
+    with _executor_lock:
+        _schema_generation += 1
+
+
+atexit.register(clear_executor_cache)
+
+
 def run_sql_executor(
     sql: str,
     dialect: str = "sqlite",
     db_path: Optional[str] = None,
     connection_string: Optional[str] = None,
+    verbose: bool = True,
 ) -> Dict[str, Any]:
     """
     Run SQL through the SQLExecutor.
 
+    The executor for the database is reused by later calls in the same
+    thread (see get_executor).
+
     Returns the raw executor output dictionary.
     """
-    executor = create_executor(dialect, db_path, connection_string)
+    executor = get_executor(dialect, db_path, connection_string)
     try:
-        result = executor.process_query(sql, verbose=True)
-        return result.to_dict()
+        result = executor.process_query(sql, verbose=verbose)
     finally:
-        executor.close()
+        if not executor.is_read_only(sql):
+            _schema_may_have_changed()
+    return result.to_dict()
 
 
 def convert_to_execution_result(agent_output: Dict[str, Any]) -> ExecutionResult:
     """
     Convert SQLExecutor output to ExecutionResult for scoring.
     """
+    from evaluation.data_structures import AgentResult
+
     agent_result = AgentResult.from_agent_output(agent_output)
     return agent_result.to_execution_result()
 
@@ -107,8 +266,7 @@ def compare_results(
     """
     Compare actual results with expected results.
     """
-    comparator = DefaultResultComparator()
-    return comparator.compare(actual, expected)
+    return _comparator().compare(actual, expected)
 
 
 def score_execution(
@@ -120,8 +278,7 @@ def score_execution(
 
     Returns a dictionary with all score dimensions.
     """
-    scorer = DefaultScorer()
-    score = scorer.score(comparison, execution_result)
+    score = _scorer().score(comparison, execution_result)
 
     return {
         "overall": round(score.overall, 4),
@@ -136,7 +293,8 @@ def score_execution(
             "performance_score": round(score.performance_score, 4),
             "hallucination_score": round(score.hallucination_score, 4),
         },
-        "weights": score.weights,
+        # Copied: the scorer's weights dict is shared by every score
+        "weights": dict(score.weights),
         "details": score.details,
     }
 
@@ -147,6 +305,7 @@ def run_evaluation_pipeline(
     db_path: Optional[str] = None,
     connection_string: Optional[str] = None,
     expected_results: Optional[List[Dict[str, Any]]] = None,
+    verbose: bool = True,
 ) -> Dict[str, Any]:
     """
     Complete evaluation pipeline:
@@ -155,34 +314,39 @@ def run_evaluation_pipeline(
     3. Compare with expected results (if provided)
     4. Score the execution
     5. Return comprehensive results
+
+    Progress is printed unless ``verbose`` is False.
     """
-    print("\n" + "=" * 80)
-    print("EVALUATION PIPELINE")
-    print("=" * 80)
-    print(f"Dialect: {dialect.upper()}")
+    log = print if verbose else _silent
+    log("\n" + "=" * 80)
+    log("EVALUATION PIPELINE")
+    log("=" * 80)
+    log(f"Dialect: {dialect.upper()}")
 
     # Step 1: Run SQL through executor
-    print(f"\nStep 1: Running SQL through SQLExecutor ({dialect})...")
-    agent_output = run_sql_executor(sql, dialect, db_path, connection_string)
+    log(f"\nStep 1: Running SQL through SQLExecutor ({dialect})...")
+    agent_output = run_sql_executor(sql, dialect, db_path, connection_string, verbose)
 
     # Step 2: Convert to ExecutionResult
-    print("\nStep 2: Converting to ExecutionResult...")
+    log("\nStep 2: Converting to ExecutionResult...")
     execution_result = convert_to_execution_result(agent_output)
-    print(f"   Execution success: {execution_result.success}")
-    print(f"   Rows returned: {execution_result.rows_returned}")
-    print(f"   Execution time: {execution_result.execution_time_ms:.2f}ms")
+    log(f"   Execution success: {execution_result.success}")
+    log(f"   Rows returned: {execution_result.rows_returned}")
+    log(f"   Execution time: {execution_result.execution_time_ms:.2f}ms")
 
     # Step 3: Compare results
-    print("\nStep 3: Comparing results...")
+    log("\nStep 3: Comparing results...")
     actual_data = execution_result.data
 
     if expected_results is not None:
         comparison = compare_results(actual_data, expected_results)
-        print(f"   Expected rows: {len(expected_results)}")
-        print(f"   Match: {comparison.is_match}")
-        print(f"   Match score: {comparison.match_score:.2%}")
+        log(f"   Expected rows: {len(expected_results)}")
+        log(f"   Match: {comparison.is_match}")
+        log(f"   Match score: {comparison.match_score:.2%}")
     else:
         # No expected results - create a "self-comparison" (perfect match)
+        from evaluation.data_structures import ComparisonResult
+
         comparison = ComparisonResult(
             is_match=True,
             match_score=1.0,
@@ -190,22 +354,22 @@ def run_evaluation_pipeline(
             column_count_match=True,
             details={"message": "No expected results provided - using self-comparison"},
         )
-        print("   No expected results provided - assuming correctness")
+        log("   No expected results provided - assuming correctness")
 
     # Step 4: Score execution
-    print("\nStep 4: Scoring execution...")
+    log("\nStep 4: Scoring execution...")
     scores = score_execution(comparison, execution_result)
 
-    print(f"\n   {'=' * 40}")
-    print(f"   SCORES")
-    print(f"   {'=' * 40}")
-    print(f"   Overall Score: {scores['overall']:.2%}")
-    print(f"   {'-' * 40}")
-    print(f"   Correctness:    {scores['dimensions']['correctness']:.2%} (weight: 40%)")
-    print(f"   Efficiency:     {scores['dimensions']['efficiency']:.2%} (weight: 20%)")
-    print(f"   Safety:         {scores['dimensions']['safety']:.2%} (weight: 25%)")
-    print(f"   Completeness:   {scores['dimensions']['result_completeness']:.2%} (weight: 15%)")
-    print(f"   {'=' * 40}")
+    log(f"\n   {'=' * 40}")
+    log(f"   SCORES")
+    log(f"   {'=' * 40}")
+    log(f"   Overall Score: {scores['overall']:.2%}")
+    log(f"   {'-' * 40}")
+    log(f"   Correctness:    {scores['dimensions']['correctness']:.2%} (weight: 40%)")
+    log(f"   Efficiency:     {scores['dimensions']['efficiency']:.2%} (weight: 20%)")
+    log(f"   Safety:         {scores['dimensions']['safety']:.2%} (weight: 25%)")
+    log(f"   Completeness:   {scores['dimensions']['result_completeness']:.2%} (weight: 15%)")
+    log(f"   {'=' * 40}")
 
     # Compile final output
     pipeline_result = {
@@ -230,6 +394,215 @@ def run_evaluation_pipeline(
     return pipeline_result
 
 
+def _canonical(value: Any) -> Any:
+    """Hashable, type-aware form of a result value (Decimal('1') != '1')."""
+    if isinstance(value, dict):
+        return ("dict", tuple(sorted(
+            ((repr(k), _canonical(v)) for k, v in value.items()),
+            key=lambda item: item[0],
+        )))
+    if isinstance(value, (list, tuple)):
+        return (type(value).__name__, tuple(_canonical(v) for v in value))
+    try:
+        hash(value)
+    except TypeError:
+        value = repr(value)
+    return (type(value).__name__, value)
+
+
+class _ExpectedRows:
+    """
+    Expected result set usable as an LRU cache key.
+
+    The rows travel inside the cache entry, so they are evicted with it.
+    """
+
+    __slots__ = ("rows", "_key")
+
+    def __init__(self, rows: List[Dict[str, Any]]):
+        self.rows = rows
+        self._key = _canonical(rows)
+
+    def __hash__(self) -> int:
+        return hash(self._key)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, _ExpectedRows) and self._key == other._key
+
+
+@lru_cache(maxsize=256)
+def _cached_pipeline(
+    sql: str,
+    dialect: str,
+    db_path: Optional[str],
+    connection_string: Optional[str],
+    expected: Optional[_ExpectedRows],
+) -> Dict[str, Any]:
+    return run_evaluation_pipeline(
+        sql=sql,
+        dialect=dialect,
+        db_path=db_path,
+        connection_string=connection_string,
+        expected_results=expected.rows if expected is not None else None,
+        verbose=False,
+    )
+
+
+def clear_pipeline_cache() -> None:
+    """Forget cached pipeline results (e.g. after the database changes)."""
+    _cached_pipeline.cache_clear()
+    clear_executor_cache()
+
+
+def iter_evaluation_pipelines(
+    sqls: Sequence[str],
+    dialect: str = "sqlite",
+    db_path: Optional[str] = None,
+    connection_string: Optional[str] = None,
+    expected_results: Optional[Sequence[Optional[List[Dict[str, Any]]]]] = None,
+    max_workers: int = 4,
+    use_cache: bool = False,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Evaluate several independent queries concurrently, yielding results.
+
+    Same as run_evaluation_pipelines, but each result is yielded in input
+    order as soon as it (and every earlier one) is ready and is not kept
+    afterwards, so callers that only aggregate scores never hold every
+    result set in memory at once.
+    """
+    if expected_results is None:
+        expected_results = [None] * len(sqls)
+    elif len(expected_results) != len(sqls):
+        raise ValueError("expected_results must have the same length as sqls")
+
+    def evaluate(sql: str, expected: Optional[List[Dict[str, Any]]]) -> Dict[str, Any]:
+        if use_cache:
+            return copy.deepcopy(_cached_pipeline(
+                sql, dialect, db_path, connection_string,
+                None if expected is None else _ExpectedRows(expected),
+            ))
+        return run_evaluation_pipeline(
+            sql=sql,
+            dialect=dialect,
+            db_path=db_path,
+            connection_string=connection_string,
+            expected_results=expected,
+            verbose=False,
+        )
+
+    if max_workers <= 1 or len(sqls) <= 1:
+        for sql, expected in zip(sqls, expected_results):
+            yield evaluate(sql, expected)
+        return
+
+    # Only a bounded window of queries is in flight, so finished results
+    # never pile up far ahead of the consumer
+    workers = min(max_workers, len(sqls))
+    window: Deque[Future] = deque()
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for sql, expected in zip(sqls, expected_results):
+            if len(window) >= 2 * workers:
+                yield window.popleft().result()
+            window.append(pool.submit(evaluate, sql, expected))
+        while window:
+            yield window.popleft().result()
+
+
+def run_evaluation_pipelines(
+    sqls: Sequence[str],
+    dialect: str = "sqlite",
+    db_path: Optional[str] = None,
+    connection_string: Optional[str] = None,
+    expected_results: Optional[Sequence[Optional[List[Dict[str, Any]]]]] = None,
+    max_workers: int = 4,
+    use_cache: bool = False,
+) -> List[Dict[str, Any]]:
+    """
+    Evaluate several independent queries concurrently.
+
+    Each worker thread uses its own executor and database connection,
+    reused for the queries it runs, so the I/O-bound execution step
+    overlaps across a thread pool. Progress output is suppressed; results
+    are returned in input order.
+
+    With ``use_cache`` enabled, repeated (query, database, expected rows)
+    combinations are evaluated once and served from an LRU cache. Only
+    enable it while the target database is not being modified.
+
+    Args:
+        sqls: SQL queries to evaluate
+        dialect: Database dialect shared by all queries
+        db_path: Path to database file (for SQLite, DuckDB)
+        connection_string: Connection string (for PostgreSQL)
+        expected_results: Optional expected rows per query (same length as sqls)
+        max_workers: Maximum number of pipelines running at once
+        use_cache: Reuse results for duplicate evaluations
+
+    Returns:
+        One pipeline result per query, in the same order as ``sqls``
+    """
+    return list(iter_evaluation_pipelines(
+        sqls,
+        dialect=dialect,
+        db_path=db_path,
+        connection_string=connection_string,
+        expected_results=expected_results,
+        max_workers=max_workers,
+        use_cache=use_cache,
+    ))
+
+
+def save_results(results: Any, filepath: str) -> None:
+    """Write pipeline results to a JSON file."""
+    if orjson is not None:
+        with open(filepath, 'wb') as f:
+            f.write(orjson.dumps(
+                results,
+                default=str,
+                # Passthrough keeps datetimes and dataclasses on default=str,
+                # matching the json fallback byte for byte
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_NON_STR_KEYS
+                    | orjson.OPT_PASSTHROUGH_DATETIME
+                    | orjson.OPT_PASSTHROUGH_DATACLASS
+                ),
+            ))
+    else:
+        with open(filepath, 'w') as f:
+            json.dump(results, f, indent=2, default=str)
+    print(f"\nResults saved to: {filepath}")
+
+
+def run_script(statements: List[str], args: argparse.Namespace) -> List[Dict[str, Any]]:
+    """Evaluate each statement of a multi-statement script in turn."""
+    results = []
+    for i, statement in enumerate(statements, 1):
+        if not args.quiet:
+            print(f"\n[Statement {i}/{len(statements)}]")
+        results.append(run_evaluation_pipeline(
+            sql=statement,
+            dialect=args.dialect,
+            db_path=args.db_path,
+            connection_string=args.connection_string,
+            verbose=not args.quiet,
+        ))
+
+    if args.output:
+        save_results(results, args.output)
+
+    print("\n" + "=" * 80)
+    print("PIPELINE COMPLETE")
+    print("=" * 80)
+    print(f"Dialect: {args.dialect.upper()}")
+    for i, result in enumerate(results, 1):
+        print(f"Statement {i} Score: {result['scores']['overall']:.2%}")
+    print("=" * 80 + "\n")
+
+    return results
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Run SQL through multi-dialect SQLExecutor and score with Evaluation pipeline"
@@ -265,6 +638,11 @@ def main():
         "--output", "-o",
         help="Path to save the results as JSON",
     )
+    parser.add_argument(
+        "--quiet", "-q",
+        action="store_true",
+        help="Only print the final summary, without per-step progress",
+    )
 
     args = parser.parse_args()
 
@@ -282,20 +660,26 @@ def main():
     if args.expected:
         expected_results = load_expected_results(args.expected)
 
+    statements = list(iter_sql_statements(sql, args.dialect)) or [sql]
+    if len(statements) > 1:
+        if expected_results is not None:
+            print("Error: --expected requires a single SQL statement")
+            sys.exit(1)
+        return run_script(statements, args)
+
     # Run the pipeline
     result = run_evaluation_pipeline(
-        sql=sql,
+        sql=statements[0],
         dialect=args.dialect,
         db_path=args.db_path,
         connection_string=args.connection_string,
         expected_results=expected_results,
+        verbose=not args.quiet,
     )
 
     # Save output if requested
     if args.output:
-        with open(args.output, 'w') as f:
-            json.dump(result, f, indent=2, default=str)
-        print(f"\nResults saved to: {args.output}")
+        save_results(result, args.output)
 
     # Print final summary
     print("\n" + "=" * 80)
@@ -3,14 +3,14 @@
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Dict, List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 
 # ============================================================
 # SCHEMA MODELS (Dev 1 produces, Dev 2/3/4 consume)
 # ============================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ColumnInfo:
     """Column metadata from schema introspection."""
     name: str
@@ -20,37 +20,69 @@ class ColumnInfo:
     foreign_key: Optional[str] = None  # "table.column" format
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
+class ForeignKey:
+    """Foreign key relationship from schema introspection."""
+    column: str
+    references_table: str
+    references_column: str
+    constraint_name: Optional[str] = None
+
+
+@dataclass(slots=True)
 class TableInfo:
     """Table metadata from schema introspection."""
     name: str
     columns: List[ColumnInfo]
     row_count: Optional[int] = None
+    schema: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaSnapshot:
     """Complete schema snapshot for validation."""
     dialect: str
     database: str
     tables: Dict[str, TableInfo]
-    captured_at: datetime = field(default_factory=datetime.utcnow)
+    foreign_keys: Dict[str, List[ForeignKey]] = field(default_factory=dict)
+    captured_at: datetime = field(default_factory=lambda: datetime.now(timezone.utc))
+    # Lowercased names, built on first lookup rather than on every call
+    _table_names_lower: Optional[frozenset] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _column_names_lower: Dict[str, frozenset] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+
+    def get_table(self, name: str) -> Optional[TableInfo]:
+        table = self.tables.get(name)
+        if table is None and self.has_table(name):
+            name_lower = name.lower()
+            table = next(t for n, t in self.tables.items() if n.lower() == name_lower)
+        return table
 
     def has_table(self, name: str) -> bool:
-        return name.lower() in {t.lower() for t in self.tables}
+        if self._table_names_lower is None:
+            self._table_names_lower = frozenset(t.lower() for t in self.tables)
+        return name.lower() in self._table_names_lower
 
     def has_column(self, table: str, column: str) -> bool:
-        tbl = self.tables.get(table)
-        if not tbl:
-            return False
-        return column.lower() in {c.name.lower() for c in tbl.columns}
+        names = self._column_names_lower.get(table)
+        if names is None:
+            tbl = self.tables.get(table)
+            if not tbl:
+                return False
+            names = self._column_names_lower[table] = frozenset(
+                c.name.lower() for c in tbl.columns
+            )
+        return column.lower() in names
 
 
 # ============================================================
 # VALIDATION MODELS (Dev 2 produces, Dev 3/4 consume)
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class IdentifierSet:
     """Extracted SQL identifiers."""
     tables: List[str]
@@ -59,7 +91,7 @@ class IdentifierSet:
     aliases: Dict[str, str]  # alias -> actual name
 
 
-@dataclass
+@dataclass(slots=True)
 class HallucinationReport:
     """Report of phantom identifiers in SQL."""
     phantom_tables: List[str]
@@ -76,7 +108,7 @@ class HallucinationReport:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """Result of SQL validation against schema."""
     is_valid: bool
@@ -89,7 +121,7 @@ class ValidationResult:
 # EXECUTION MODELS (Dev 4 produces)
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of SQL execution."""
     success: bool
@@ -100,7 +132,7 @@ class ExecutionResult:
     error: Optional[str] = None
 
 
-@dataclass
+@dataclass(slots=True)
 class QueryPlan:
     """Query execution plan from EXPLAIN."""
     raw_plan: str
@@ -124,7 +156,7 @@ class ErrorCategory(Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class ComparisonResult:
     """Result of comparing actual vs expected results."""
     match: bool
@@ -133,7 +165,7 @@ class ComparisonResult:
     details: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MultiDimensionalScore:
     """Multi-dimensional evaluation score."""
     correctness: float          # 0.0 to 1.0, weight 40%
@@ -155,7 +187,7 @@ class MultiDimensionalScore:
 # TASK MODELS (Shared)
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Evaluation task definition."""
     id: str
@@ -172,7 +204,7 @@ class Task:
 # TOOL MODELS (Dev 3 produces, Dev 4 consumes)
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class ToolResult:
     """Result from tool execution."""
     success: bool
@@ -181,7 +213,7 @@ class ToolResult:
     metadata: Dict[str, Any] = field(default_factory=dict)
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionTrace:
     """Trace of agent session."""
     task_id: str
@@ -9,8 +9,9 @@ Each dialect has:
 """
 
 from enum import Enum
+from functools import lru_cache
 from dataclasses import dataclass, field
-from typing import Optional, Set, Dict, Any
+from typing import Optional, FrozenSet, Dict, Any
 
 
 class Dialect(Enum):
@@ -40,7 +41,7 @@ class DialectConfig:
     supports_arrays: bool = False
 
     # Built-in functions valid for this dialect
-    builtin_functions: Set[str] = field(default_factory=set)
+    builtin_functions: FrozenSet[str] = field(default_factory=frozenset)
 
     # Additional metadata
     description: str = ""
@@ -49,7 +50,7 @@ class DialectConfig:
 # =============================================================================
 # SQLITE FUNCTIONS
 # =============================================================================
-SQLITE_FUNCTIONS: Set[str] = {
+SQLITE_FUNCTIONS: FrozenSet[str] = frozenset({
     # Aggregate functions
     "AVG", "COUNT", "GROUP_CONCAT", "MAX", "MIN", "SUM", "TOTAL",
 
@@ -85,12 +86,12 @@ SQLITE_FUNCTIONS: Set[str] = {
 
     # Type conversion
     "CAST", "TYPEOF",
-}
+})
 
 # =============================================================================
 # DUCKDB FUNCTIONS
 # =============================================================================
-DUCKDB_FUNCTIONS: Set[str] = {
+DUCKDB_FUNCTIONS: FrozenSet[str] = frozenset({
     # Standard SQL
     "ABS", "AVG", "CEIL", "CEILING", "COUNT", "FLOOR", "MAX", "MIN",
     "ROUND", "SUM", "TRUNC",
@@ -137,12 +138,12 @@ DUCKDB_FUNCTIONS: Set[str] = {
     "HASH", "MD5", "SHA256",
     "RANDOM", "SETSEED", "UUID",
     "DESCRIBE", "PRAGMA_TABLE_INFO",
-}
+})
 
 # =============================================================================
 # BIGQUERY FUNCTIONS
 # =============================================================================
-BIGQUERY_FUNCTIONS: Set[str] = {
+BIGQUERY_FUNCTIONS: FrozenSet[str] = frozenset({
     # Standard SQL
     "ABS", "AVG", "CEIL", "CEILING", "COUNT", "FLOOR", "MAX", "MIN",
     "MOD", "ROUND", "SUM", "TRUNC", "DIV", "IEEE_DIVIDE",
@@ -228,12 +229,12 @@ BIGQUERY_FUNCTIONS: Set[str] = {
     "BIT_COUNT", "NET.IP_FROM_STRING", "NET.SAFE_IP_FROM_STRING", "NET.IP_TO_STRING",
     "NET.IP_NET_MASK", "NET.IP_TRUNC", "NET.IPV4_FROM_INT64", "NET.IPV4_TO_INT64",
     "NET.HOST", "NET.PUBLIC_SUFFIX", "NET.REG_DOMAIN",
-}
+})
 
 # =============================================================================
 # POSTGRESQL FUNCTIONS
 # =============================================================================
-POSTGRESQL_FUNCTIONS: Set[str] = {
+POSTGRESQL_FUNCTIONS: FrozenSet[str] = frozenset({
     # Aggregate functions
     "AVG", "BIT_AND", "BIT_OR", "BIT_XOR", "BOOL_AND", "BOOL_OR",
     "COUNT", "EVERY", "JSON_AGG", "JSONB_AGG", "JSON_OBJECT_AGG", "JSONB_OBJECT_AGG",
@@ -315,12 +316,12 @@ POSTGRESQL_FUNCTIONS: Set[str] = {
     "SHA224", "SHA256", "SHA384", "SHA512",
     "CURRENT_USER", "CURRENT_ROLE", "CURRENT_SCHEMA", "CURRENT_CATALOG",
     "SESSION_USER", "USER",
-}
+})
 
 # =============================================================================
 # SNOWFLAKE FUNCTIONS
 # =============================================================================
-SNOWFLAKE_FUNCTIONS: Set[str] = {
+SNOWFLAKE_FUNCTIONS: FrozenSet[str] = frozenset({
     # Aggregate functions
     "ANY_VALUE", "APPROX_COUNT_DISTINCT", "APPROX_PERCENTILE", "APPROX_TOP_K",
     "ARRAY_AGG", "AVG", "BITAND_AGG", "BITOR_AGG", "BITXOR_AGG",
@@ -416,7 +417,7 @@ SNOWFLAKE_FUNCTIONS: Set[str] = {
     "CURRENT_TRANSACTION", "CURRENT_USER", "CURRENT_VERSION", "CURRENT_WAREHOUSE",
     "GET_DDL", "HASH", "LAST_QUERY_ID", "LAST_TRANSACTION", "LOCALTIME",
     "SYSTEM$TYPEOF", "UUID_STRING",
-}
+})
 
 
 # =============================================================================
@@ -498,16 +499,20 @@ DIALECT_CONFIGS: Dict[Dialect, DialectConfig] = {
         supports_window_functions=True,  # MySQL 8.0+
         supports_json=True,
         supports_arrays=False,
-        builtin_functions=set(),  # TODO: Add MySQL functions
+        builtin_functions=frozenset(),  # TODO: Add MySQL functions
         description="MySQL - Popular open source database"
     ),
 }
 
 
+@lru_cache(maxsize=32)
 def get_dialect_config(dialect: str) -> DialectConfig:
     """
     Get configuration for a dialect by name.
 
+    Lookups are memoized per spelling of the name; the returned
+    DialectConfig is shared and must not be mutated.
+
     Args:
         dialect: Dialect name (e.g., "sqlite", "bigquery", "postgresql")
 
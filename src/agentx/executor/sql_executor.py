@@ -13,20 +13,25 @@ It does NOT generate SQL - that's the job of the LLM being evaluated.
 Supports: SQLite, DuckDB, PostgreSQL, BigQuery, Snowflake
 """
 
+import re
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 
-from ..dialects import get_dialect_config, Dialect
+from ..dialects import Dialect
 from ..infrastructure import DatabaseAdapter, create_adapter, SchemaSnapshot
 from ..validation import (
     MultiDialectSQLParser,
+    ParsedSQL,
     HallucinationDetector,
     HallucinationReport,
     ValidationResult,
 )
 
 
+_LIMIT_RE = re.compile(r"\bLIMIT\b", re.IGNORECASE)
+
+
 @dataclass
 class ExecutorConfig:
     """Configuration for SQLExecutor."""
@@ -178,7 +183,7 @@ class SQLExecutor:
         self.schema = self.adapter.get_schema_snapshot()
         return self.schema
 
-    def validate_query(self, sql: str) -> ValidationResult:
+    def validate_query(self, sql: str, parsed: Optional[ParsedSQL] = None) -> ValidationResult:
         """
         Validate SQL query against the schema.
 
@@ -190,16 +195,34 @@ class SQLExecutor:
 
         Args:
             sql: SQL query to validate
+            parsed: Already-parsed form of sql (optional)
 
         Returns:
             ValidationResult with errors, warnings, and hallucination report
         """
-        return self.detector.validate(sql, self.schema, self.dialect)
+        return self.detector.validate(sql, self.schema, self.dialect, parsed)
+
+    def is_read_only(self, sql: str) -> bool:
+        """
+        Whether the SQL parses as a read-only query, so its results can be reused.
+
+        SELECT ... INTO and queries with data-modifying CTEs write, so they
+        do not count.
+        """
+        from sqlglot import exp
+
+        parsed = self.parser.parse(sql, self.dialect)
+        return (
+            parsed.is_valid
+            and isinstance(parsed.ast, exp.Query)
+            and parsed.ast.find(exp.Into, exp.Insert, exp.Update, exp.Delete, exp.Merge) is None
+        )
 
     def execute_query(
         self,
         sql: str,
-        limit: Optional[int] = None
+        limit: Optional[int] = None,
+        parsed: Optional[ParsedSQL] = None
     ) -> Dict[str, Any]:
         """
         Execute SQL query and return results.
@@ -207,6 +230,7 @@ class SQLExecutor:
         Args:
             sql: SQL query to execute
             limit: Override row limit (default from config)
+            parsed: Already-parsed form of sql (optional)
 
         Returns:
             Dictionary with execution results
@@ -214,9 +238,10 @@ class SQLExecutor:
         limit = limit or self.config.row_limit
 
         # Add LIMIT clause if not present and it's a SELECT
-        parsed = self.parser.parse(sql, self.dialect)
+        if parsed is None:
+            parsed = self.parser.parse(sql, self.dialect)
         if parsed.is_select:
-            sql = self._add_limit(sql, limit)
+            sql = self._add_limit(sql, limit, parsed.ast)
 
         result = self.adapter.execute(sql)
 
@@ -230,14 +255,17 @@ class SQLExecutor:
             "dialect": self.dialect,
         }
 
-    def _add_limit(self, sql: str, limit: int) -> str:
+    def _add_limit(self, sql: str, limit: int, ast: Any = None) -> str:
         """Add LIMIT clause if not already present."""
-        import sqlglot
         from sqlglot import exp
 
         try:
-            config = get_dialect_config(self.dialect)
-            ast = sqlglot.parse_one(sql, read=config.sqlglot_dialect)
+            if ast is None:
+                ast = self.parser.parse(sql, self.dialect).ast
+            if ast is None:
+                # The parser already tried every fallback dialect;
+                # parsing again would only fail again
+                raise ValueError("unparseable SQL")
 
             # Check if LIMIT already exists
             if ast.find(exp.Limit):
@@ -248,8 +276,9 @@ class SQLExecutor:
             return f"{sql} LIMIT {limit}"
 
         except Exception:
-            # Fallback: simple string check
-            if "limit" not in sql.lower():
+            # Fallback: keyword check (word-bounded, so e.g. a credit_limit
+            # column does not count as a LIMIT clause)
+            if not _LIMIT_RE.search(sql):
                 sql = sql.rstrip(";").strip()
                 return f"{sql} LIMIT {limit}"
             return sql
@@ -282,15 +311,16 @@ class SQLExecutor:
 
         # Extract query metadata for scoring
         parsed = self.parser.parse(sql, self.dialect)
-        tables_accessed = parsed.identifiers.tables
-        columns_accessed = parsed.identifiers.columns
+        # Copied: parse results are cached and shared
+        tables_accessed = list(parsed.identifiers.tables)
+        columns_accessed = list(parsed.identifiers.columns)
 
         # Step 1: Validation
         if validate:
             if verbose:
                 print(f"Validating query for {self.dialect}...")
 
-            validation = self.validate_query(sql)
+            validation = self.validate_query(sql, parsed)
             result.validation = {
                 "is_valid": validation.is_valid,
                 "errors": validation.errors,
@@ -324,7 +354,7 @@ class SQLExecutor:
         if verbose:
             print(f"Executing query...")
 
-        execution = self.execute_query(sql)
+        execution = self.execute_query(sql, parsed=parsed)
         result.execution = execution
 
         if not execution["success"]:
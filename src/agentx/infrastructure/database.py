@@ -14,14 +14,20 @@ Supported dialects:
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, Union
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Union
 from dataclasses import dataclass
 import time
 
 from .models import ColumnInfo, TableInfo, SchemaSnapshot
 
+# Rows fetched per round when streaming DuckDB and PostgreSQL results
+# into dicts
+_FETCH_BATCH_SIZE = 10000
 
-@dataclass
+
+@dataclass(slots=True)
 class ExecutionResult:
     """Result of SQL query execution."""
     success: bool
@@ -75,6 +81,17 @@ class DatabaseAdapter(ABC):
             results.append(self.execute(sql))
         return results
 
+    @contextmanager
+    def transaction(self, durable: bool = True) -> Iterator[None]:
+        """
+        Group the statements executed inside the block into one commit.
+
+        Adapters that cannot defer commits run each statement as before.
+        Passing ``durable=False`` lets adapters skip syncing the commit to
+        disk, for throwaway data such as seeded fixtures.
+        """
+        yield
+
 
 # =============================================================================
 # SQLITE ADAPTER
@@ -97,11 +114,14 @@ class SQLiteAdapter(DatabaseAdapter):
         """
         self.db_path = db_path
         self.conn = None
+        self._in_transaction = False
 
     def connect(self):
         """Create SQLite connection."""
         import sqlite3
-        self.conn = sqlite3.connect(self.db_path)
+        # The connection may be closed (or handed over) by a thread other
+        # than the one that opened it; sqlite3 serializes access itself
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
         self.conn.row_factory = sqlite3.Row
         return self.conn
 
@@ -114,6 +134,38 @@ class SQLiteAdapter(DatabaseAdapter):
     def get_dialect(self) -> str:
         return "sqlite"
 
+    @contextmanager
+    def transaction(self, durable: bool = True) -> Iterator[None]:
+        """
+        Defer the per-statement commits until the block ends.
+
+        With ``durable=False`` the commit runs with PRAGMA synchronous = OFF.
+        """
+        if self._in_transaction:
+            yield
+            return
+        if not self.conn:
+            self.connect()
+
+        # The sync level can only be changed outside a transaction
+        relax_sync = not durable and not self.conn.in_transaction
+        if relax_sync:
+            synchronous = self.conn.execute("PRAGMA synchronous").fetchone()[0]
+            self.conn.execute("PRAGMA synchronous = OFF")
+
+        self._in_transaction = True
+        try:
+            yield
+        except BaseException:
+            self.conn.rollback()
+            raise
+        else:
+            self.conn.commit()
+        finally:
+            self._in_transaction = False
+            if relax_sync:
+                self.conn.execute(f"PRAGMA synchronous = {synchronous}")
+
     def get_schema_snapshot(self) -> SchemaSnapshot:
         """Get schema from SQLite database."""
         if not self.conn:
@@ -128,36 +180,40 @@ class SQLiteAdapter(DatabaseAdapter):
             WHERE type='table' AND name NOT LIKE 'sqlite_%'
             ORDER BY name
         """)
+        table_names = [row[0] for row in cursor.fetchall()]
 
-        for (table_name,) in cursor.fetchall():
-            # Get columns using PRAGMA
-            cursor.execute(f"PRAGMA table_info('{table_name}')")
-            columns = []
+        # Columns and foreign keys for every table in one query each, via
+        # the table-valued PRAGMA functions, instead of two PRAGMAs per table
+        columns_by_table: Dict[str, List[ColumnInfo]] = {name: [] for name in table_names}
+        cursor.execute("""
+            SELECT m.name, p.name, p.type, p."notnull", p.dflt_value, p.pk
+            FROM sqlite_master AS m, pragma_table_info(m.name) AS p
+            WHERE m.type='table' AND m.name NOT LIKE 'sqlite_%'
+            ORDER BY m.name, p.cid
+        """)
+        for table_name, name, dtype, notnull, default, pk in cursor.fetchall():
+            columns_by_table[table_name].append(ColumnInfo(
+                name=name,
+                dtype=dtype or "TEXT",
+                nullable=not bool(notnull),
+                primary_key=bool(pk),
+                default=default,
+            ))
 
-            for row in cursor.fetchall():
-                # PRAGMA table_info returns:
-                # cid, name, type, notnull, dflt_value, pk
-                columns.append(ColumnInfo(
-                    name=row[1],
-                    dtype=row[2] or "TEXT",
-                    nullable=not bool(row[3]),
-                    primary_key=bool(row[5]),
-                    default=row[4],
-                ))
+        cursor.execute("""
+            SELECT m.name, f."from", f."table", f."to"
+            FROM sqlite_master AS m, pragma_foreign_key_list(m.name) AS f
+            WHERE m.type='table' AND m.name NOT LIKE 'sqlite_%'
+        """)
+        for table_name, from_col, to_table, to_col in cursor.fetchall():
+            # Update column with FK info
+            for col in columns_by_table[table_name]:
+                if col.name == from_col:
+                    col.foreign_key = f"{to_table}.{to_col}"
+                    break
 
-            # Get foreign keys
-            cursor.execute(f"PRAGMA foreign_key_list('{table_name}')")
-            for fk_row in cursor.fetchall():
-                # id, seq, table, from, to, on_update, on_delete, match
-                from_col = fk_row[3]
-                to_table = fk_row[2]
-                to_col = fk_row[4]
-
-                # Update column with FK info
-                for col in columns:
-                    if col.name == from_col:
-                        col.foreign_key = f"{to_table}.{to_col}"
-                        break
+        for table_name in table_names:
+            columns = columns_by_table[table_name]
 
             # Get row count
             try:
@@ -183,7 +239,7 @@ class SQLiteAdapter(DatabaseAdapter):
         if not self.conn:
             self.connect()
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             cursor = self.conn.cursor()
@@ -192,10 +248,11 @@ class SQLiteAdapter(DatabaseAdapter):
             # Check if query returns data
             if cursor.description:
                 columns = [desc[0] for desc in cursor.description]
-                rows = cursor.fetchall()
-                data = [dict(zip(columns, row)) for row in rows]
+                # Build the dicts straight from the cursor rather than
+                # holding a fetchall() copy of every row alongside them
+                data = [dict(zip(columns, row)) for row in cursor]
 
-                elapsed = (time.time() - start_time) * 1000
+                elapsed = (time.perf_counter() - start_time) * 1000
                 return ExecutionResult(
                     success=True,
                     data=data,
@@ -206,8 +263,9 @@ class SQLiteAdapter(DatabaseAdapter):
                 )
             else:
                 # Non-SELECT query
-                self.conn.commit()
-                elapsed = (time.time() - start_time) * 1000
+                if not self._in_transaction:
+                    self.conn.commit()
+                elapsed = (time.perf_counter() - start_time) * 1000
                 return ExecutionResult(
                     success=True,
                     data=[],
@@ -218,7 +276,7 @@ class SQLiteAdapter(DatabaseAdapter):
                 )
 
         except Exception as e:
-            elapsed = (time.time() - start_time) * 1000
+            elapsed = (time.perf_counter() - start_time) * 1000
             return ExecutionResult(
                 success=False,
                 data=[],
@@ -290,25 +348,25 @@ class DuckDBAdapter(DatabaseAdapter):
             ORDER BY table_name
         """).fetchall()
 
+        # Get the columns of every table in one query rather than one per table
+        columns_by_table: Dict[str, List[ColumnInfo]] = {name: [] for (name,) in result}
+        cols = self.conn.execute("""
+            SELECT table_name, column_name, data_type, is_nullable, column_default
+            FROM information_schema.columns
+            WHERE table_schema = 'main'
+            ORDER BY table_name, ordinal_position
+        """).fetchall()
+        for col in cols:
+            if col[0] in columns_by_table:
+                columns_by_table[col[0]].append(ColumnInfo(
+                    name=col[1],
+                    dtype=col[2],
+                    nullable=(col[3] == 'YES'),
+                    default=col[4],
+                ))
+
         for (table_name,) in result:
-            # Get columns
-            cols = self.conn.execute(f"""
-                SELECT column_name, data_type, is_nullable, column_default
-                FROM information_schema.columns
-                WHERE table_name = '{table_name}'
-                AND table_schema = 'main'
-                ORDER BY ordinal_position
-            """).fetchall()
-
-            columns = [
-                ColumnInfo(
-                    name=col[0],
-                    dtype=col[1],
-                    nullable=(col[2] == 'YES'),
-                    default=col[3],
-                )
-                for col in cols
-            ]
+            columns = columns_by_table[table_name]
 
             # Get row count
             try:
@@ -336,17 +394,20 @@ class DuckDBAdapter(DatabaseAdapter):
         if not self.conn:
             self.connect()
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             result = self.conn.execute(sql)
 
             if result.description:
                 columns = [desc[0] for desc in result.description]
-                rows = result.fetchall()
-                data = [dict(zip(columns, row)) for row in rows]
+                # Convert in batches so only one batch of raw tuples is
+                # held alongside the dicts
+                data = []
+                while rows := result.fetchmany(_FETCH_BATCH_SIZE):
+                    data.extend(dict(zip(columns, row)) for row in rows)
 
-                elapsed = (time.time() - start_time) * 1000
+                elapsed = (time.perf_counter() - start_time) * 1000
                 return ExecutionResult(
                     success=True,
                     data=data,
@@ -356,7 +417,7 @@ class DuckDBAdapter(DatabaseAdapter):
                     dialect="duckdb",
                 )
             else:
-                elapsed = (time.time() - start_time) * 1000
+                elapsed = (time.perf_counter() - start_time) * 1000
                 return ExecutionResult(
                     success=True,
                     data=[],
@@ -367,7 +428,7 @@ class DuckDBAdapter(DatabaseAdapter):
                 )
 
         except Exception as e:
-            elapsed = (time.time() - start_time) * 1000
+            elapsed = (time.perf_counter() - start_time) * 1000
             return ExecutionResult(
                 success=False,
                 data=[],
@@ -383,6 +444,42 @@ class DuckDBAdapter(DatabaseAdapter):
 # POSTGRESQL ADAPTER (using SQLAlchemy for compatibility)
 # =============================================================================
 
+@lru_cache(maxsize=None)
+def _get_engine(connection_string: str):
+    """
+    Shared SQLAlchemy engine for a connection string.
+
+    Adapters for the same database draw connections from one pool, so
+    creating an adapter per task does not open a new server connection
+    each time. Pooled connections are checked on checkout and recycled
+    after five minutes so a long-lived pool never hands out a dead one.
+    """
+    from sqlalchemy import create_engine
+    return create_engine(connection_string, pool_pre_ping=True, pool_recycle=300)
+
+
+@lru_cache(maxsize=256)
+def _is_streamable_query(sql: str) -> bool:
+    """
+    Whether a statement may run through a server-side cursor.
+
+    psycopg streams results by wrapping the statement in DECLARE ... CURSOR,
+    which only accepts plain queries: DDL, DML, SELECT INTO, data-modifying
+    CTEs and anything sqlglot cannot parse run on a regular cursor instead.
+    """
+    import sqlglot
+    from sqlglot import exp
+
+    try:
+        ast = sqlglot.parse_one(sql, read="postgres")
+    except sqlglot.errors.SqlglotError:
+        return False
+    return (
+        isinstance(ast, exp.Query)
+        and ast.find(exp.Into, exp.Insert, exp.Update, exp.Delete, exp.Merge) is None
+    )
+
+
 class PostgreSQLAdapter(DatabaseAdapter):
     """
     PostgreSQL database adapter using SQLAlchemy.
@@ -403,8 +500,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
     def connect(self):
         """Create PostgreSQL connection."""
         try:
-            from sqlalchemy import create_engine
-            self.engine = create_engine(self.connection_string)
+            self.engine = _get_engine(self.connection_string)
             self.conn = self.engine.connect()
             return self.conn
         except ImportError:
@@ -413,13 +509,11 @@ class PostgreSQLAdapter(DatabaseAdapter):
             )
 
     def close(self) -> None:
-        """Close PostgreSQL connection."""
+        """Return the connection to the shared pool."""
         if self.conn:
             self.conn.close()
             self.conn = None
-        if self.engine:
-            self.engine.dispose()
-            self.engine = None
+        self.engine = None
 
     def get_dialect(self) -> str:
         return "postgres"
@@ -483,16 +577,24 @@ class PostgreSQLAdapter(DatabaseAdapter):
 
         from sqlalchemy import text
 
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
-            result = self.conn.execute(text(sql))
+            statement = text(sql)
+            if _is_streamable_query(sql):
+                # yield_per streams query results through a server-side
+                # cursor in batches, so the driver never buffers the whole
+                # result set next to the dicts built from it
+                statement = statement.execution_options(yield_per=_FETCH_BATCH_SIZE)
+            result = self.conn.execute(statement)
 
             if result.returns_rows:
                 columns = list(result.keys())
-                data = [dict(row._mapping) for row in result.fetchall()]
+                # Zipping with the shared column list skips building a
+                # RowMapping view for every row
+                data = [dict(zip(columns, row)) for row in result]
 
-                elapsed = (time.time() - start_time) * 1000
+                elapsed = (time.perf_counter() - start_time) * 1000
                 return ExecutionResult(
                     success=True,
                     data=data,
@@ -502,7 +604,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
                     dialect="postgresql",
                 )
             else:
-                elapsed = (time.time() - start_time) * 1000
+                elapsed = (time.perf_counter() - start_time) * 1000
                 return ExecutionResult(
                     success=True,
                     data=[],
@@ -513,7 +615,7 @@ class PostgreSQLAdapter(DatabaseAdapter):
                 )
 
         except Exception as e:
-            elapsed = (time.time() - start_time) * 1000
+            elapsed = (time.perf_counter() - start_time) * 1000
             return ExecutionResult(
                 success=False,
                 data=[],
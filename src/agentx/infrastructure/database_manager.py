@@ -169,6 +169,8 @@ class DatabaseManager:
         params: tuple[Any, ...] | dict[str, Any] = (),
         *,
         fetch: bool = True,
+        prepare: bool | None = None,
+        binary: bool | None = None,
     ) -> list[dict[str, Any]]:
         """Execute a SQL query and return results as dictionaries.
 
@@ -179,6 +181,15 @@ class DatabaseManager:
             sql: SQL query string (use %s for parameters)
             params: Query parameters (tuple or dict)
             fetch: If True, fetch and return results. If False, return empty list.
+            prepare: True to use a server-side prepared statement straight
+                away, so repeated calls with the same SQL skip parsing and
+                planning; False to never prepare. None (the default) leaves
+                it to psycopg, which prepares a statement once it has run
+                several times on the same connection.
+            binary: True to request results in binary format, so numeric
+                and timestamp columns are not formatted as text by the
+                server and parsed back by the client. Useful for large
+                numeric-heavy result sets; None keeps psycopg's text default.
 
         Returns:
             List of dictionaries representing the result rows
@@ -196,7 +207,7 @@ class DatabaseManager:
 
         with self._pool.connection() as conn:
             with conn.cursor(row_factory=dict_row) as cur:
-                cur.execute(sql, params)
+                cur.execute(sql, params, prepare=prepare, binary=binary)
                 if fetch and cur.description is not None:
                     result = list(cur.fetchall())
                 else:
@@ -89,6 +89,29 @@ class FixtureLoader:
             logger.warning(f"No rows to load for table {table}")
             return 0
 
+        with self._db_manager.connection() as conn:
+            loaded = self._copy_rows(conn, table, rows, columns)
+            conn.commit()
+        return loaded
+
+    def _copy_rows(
+        self,
+        conn: Connection,
+        table: str,
+        rows: list[dict[str, Any]],
+        columns: list[str] | None = None,
+    ) -> int:
+        """COPY rows into a table on an open connection, without committing.
+
+        Args:
+            conn: Active connection
+            table: Target table name
+            rows: Non-empty list of dictionaries representing rows
+            columns: Optional list of columns (inferred from first row if not provided)
+
+        Returns:
+            Number of rows loaded
+        """
         # Determine columns from first row if not specified
         if columns is None:
             columns = list(rows[0].keys())
@@ -125,15 +148,12 @@ class FixtureLoader:
         col_list = ", ".join(f'"{c}"' for c in columns)
         qualified_table = f"{self._schema}.{table}"
 
-        with self._db_manager.connection() as conn:
-            with conn.cursor() as cur:
-                # Use COPY FROM STDIN with CSV format
-                copy_sql = f"COPY {qualified_table} ({col_list}) FROM STDIN WITH (FORMAT CSV, NULL '')"
-
-                with cur.copy(copy_sql) as copy:
-                    copy.write(csv_data.encode("utf-8"))
+        with conn.cursor() as cur:
+            # Use COPY FROM STDIN with CSV format
+            copy_sql = f"COPY {qualified_table} ({col_list}) FROM STDIN WITH (FORMAT CSV, NULL '')"
 
-                conn.commit()
+            with cur.copy(copy_sql) as copy:
+                copy.write(csv_data.encode("utf-8"))
 
         logger.info(f"Loaded {len(rows)} rows into {qualified_table}")
         return len(rows)
@@ -165,10 +185,6 @@ class FixtureLoader:
         with open(filepath, encoding="utf-8") as f:
             csv_data = f.read()
 
-        # Parse to count rows (excluding header if present)
-        lines = csv_data.strip().split("\n")
-        row_count = len(lines) - 1 if has_header else len(lines)
-
         with self._db_manager.connection() as conn:
             with conn.cursor() as cur:
                 copy_sql = f"""
@@ -182,6 +198,13 @@ class FixtureLoader:
                 with cur.copy(copy_sql) as copy:
                     copy.write(csv_data.encode("utf-8"))
 
+                # The COPY command tag reports the rows loaded, so the file
+                # does not need to be split into lines to count them
+                row_count = cur.rowcount
+                if row_count < 0:
+                    lines = csv_data.strip().split("\n")
+                    row_count = len(lines) - 1 if has_header else len(lines)
+
                 conn.commit()
 
         logger.info(f"Loaded {row_count} rows from CSV into {qualified_table}")
@@ -291,6 +314,8 @@ class FixtureLoader:
         """Load multiple tables with fixture data.
 
         Convenience method for loading fixtures for multiple tables.
+        All tables are loaded on one connection and committed together,
+        so either every table is loaded or none is.
 
         Args:
             fixtures: Dictionary mapping table names to row lists
@@ -305,6 +330,12 @@ class FixtureLoader:
             })
         """
         results = {}
-        for table, rows in fixtures.items():
-            results[table] = self.load(table, rows)
+        with self._db_manager.connection() as conn:
+            for table, rows in fixtures.items():
+                if not rows:
+                    logger.warning(f"No rows to load for table {table}")
+                    results[table] = 0
+                    continue
+                results[table] = self._copy_rows(conn, table, rows)
+            conn.commit()
         return results
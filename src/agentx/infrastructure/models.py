@@ -9,7 +9,7 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 
 
-@dataclass
+@dataclass(slots=True)
 class ColumnInfo:
     """Metadata for a database column."""
     name: str
@@ -30,21 +30,26 @@ class ColumnInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class TableInfo:
     """Metadata for a database table."""
     name: str
     columns: List[ColumnInfo]
     schema: Optional[str] = None
     row_count: Optional[int] = None
+    # Lowercased name -> first matching column, built on first lookup
+    _columns_by_lower: Optional[Dict[str, ColumnInfo]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def get_column(self, name: str) -> Optional[ColumnInfo]:
         """Get column by name (case-insensitive)."""
-        name_lower = name.lower()
-        for col in self.columns:
-            if col.name.lower() == name_lower:
-                return col
-        return None
+        if self._columns_by_lower is None:
+            index: Dict[str, ColumnInfo] = {}
+            for col in self.columns:
+                index.setdefault(col.name.lower(), col)
+            self._columns_by_lower = index
+        return self._columns_by_lower.get(name.lower())
 
     def has_column(self, name: str) -> bool:
         """Check if column exists (case-insensitive)."""
@@ -69,7 +74,7 @@ class TableInfo:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class SchemaSnapshot:
     """
     Complete snapshot of a database schema.
@@ -80,19 +85,23 @@ class SchemaSnapshot:
     database: str
     tables: Dict[str, TableInfo] = field(default_factory=dict)
     captured_at: datetime = field(default_factory=datetime.utcnow)
+    # Lowercased name -> first matching table, built on first lookup
+    _tables_by_lower: Optional[Dict[str, TableInfo]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def has_table(self, name: str) -> bool:
         """Check if table exists (case-insensitive)."""
-        name_lower = name.lower()
-        return any(t.lower() == name_lower for t in self.tables.keys())
+        return self.get_table(name) is not None
 
     def get_table(self, name: str) -> Optional[TableInfo]:
         """Get table by name (case-insensitive)."""
-        name_lower = name.lower()
-        for table_name, table_info in self.tables.items():
-            if table_name.lower() == name_lower:
-                return table_info
-        return None
+        if self._tables_by_lower is None:
+            index: Dict[str, TableInfo] = {}
+            for table_name, table_info in self.tables.items():
+                index.setdefault(table_name.lower(), table_info)
+            self._tables_by_lower = index
+        return self._tables_by_lower.get(name.lower())
 
     def has_column(self, table: str, column: str) -> bool:
         """Check if column exists in table (case-insensitive)."""
@@ -115,9 +124,8 @@ class SchemaSnapshot:
         Returns list of table names that have this column.
         """
         tables_with_column = []
-        column_lower = column.lower()
         for table_name, table_info in self.tables.items():
-            if any(c.name.lower() == column_lower for c in table_info.columns):
+            if table_info.has_column(column):
                 tables_with_column.append(table_name)
         return tables_with_column
 
@@ -6,7 +6,10 @@ extracting tables, columns, primary keys, and foreign key relationships.
 
 from __future__ import annotations
 
+import copy
 import logging
+import threading
+from collections import OrderedDict
 from datetime import datetime, timezone
 
 from psycopg import Connection
@@ -16,6 +19,19 @@ from agentx.core.models import ColumnInfo, ForeignKey, SchemaSnapshot, TableInfo
 
 logger = logging.getLogger(__name__)
 
+# Snapshots keyed by (database, schema, catalog fingerprint). The
+# fingerprint changes with any DDL or statistics update on the schema,
+# so a hit skips every catalog query but the fingerprint itself.
+_SNAPSHOT_CACHE_SIZE = 16
+_snapshot_cache: OrderedDict[tuple[str, str, str], SchemaSnapshot] = OrderedDict()
+_snapshot_cache_lock = threading.Lock()
+
+
+def clear_snapshot_cache() -> None:
+    """Drop all cached schema snapshots."""
+    with _snapshot_cache_lock:
+        _snapshot_cache.clear()
+
 
 class SchemaInspector:
     """Inspects PostgreSQL schema using catalog queries.
@@ -85,9 +101,26 @@ class SchemaInspector:
             for col in columns:
                 print(f"{col.name}: {col.dtype}, nullable={col.nullable}")
         """
+        return self._get_columns_by_table(table).get(table, [])
+
+    def _get_columns_by_table(self, table: str | None = None) -> dict[str, list[ColumnInfo]]:
+        """Get column information for one table, or every table in the schema.
+
+        Each catalog query covers all requested tables at once, so a full
+        snapshot costs the same three round-trips as a single table.
+
+        Args:
+            table: Table name, or None for all tables
+
+        Returns:
+            Dict mapping table name to its columns in ordinal order
+        """
+        params = {"schema": self._schema, "table": table}
+
         # Get column info from information_schema
         column_query = """
             SELECT
+                c.table_name,
                 c.column_name,
                 c.data_type,
                 c.udt_name,
@@ -97,26 +130,27 @@ class SchemaInspector:
                 c.numeric_precision,
                 c.numeric_scale
             FROM information_schema.columns c
-            WHERE c.table_schema = %s
-              AND c.table_name = %s
-            ORDER BY c.ordinal_position
+            WHERE c.table_schema = %(schema)s
+              AND (%(table)s::text IS NULL OR c.table_name = %(table)s)
+            ORDER BY c.table_name, c.ordinal_position
         """
 
         # Get primary key columns
         pk_query = """
-            SELECT kcu.column_name
+            SELECT tc.table_name, kcu.column_name
             FROM information_schema.table_constraints tc
             JOIN information_schema.key_column_usage kcu
                 ON tc.constraint_name = kcu.constraint_name
                 AND tc.table_schema = kcu.table_schema
             WHERE tc.constraint_type = 'PRIMARY KEY'
-              AND tc.table_schema = %s
-              AND tc.table_name = %s
+              AND tc.table_schema = %(schema)s
+              AND (%(table)s::text IS NULL OR tc.table_name = %(table)s)
         """
 
         # Get foreign key columns
         fk_query = """
             SELECT
+                tc.table_name,
                 kcu.column_name,
                 ccu.table_name AS references_table,
                 ccu.column_name AS references_column
@@ -128,28 +162,29 @@ class SchemaInspector:
                 ON tc.constraint_name = ccu.constraint_name
                 AND tc.table_schema = ccu.table_schema
             WHERE tc.constraint_type = 'FOREIGN KEY'
-              AND tc.table_schema = %s
-              AND tc.table_name = %s
+              AND tc.table_schema = %(schema)s
+              AND (%(table)s::text IS NULL OR tc.table_name = %(table)s)
         """
 
         with self._conn.cursor(row_factory=dict_row) as cur:
             # Get columns
-            cur.execute(column_query, (self._schema, table))
+            cur.execute(column_query, params)
             column_rows = cur.fetchall()
 
             # Get primary keys
-            cur.execute(pk_query, (self._schema, table))
-            pk_columns = {row["column_name"] for row in cur.fetchall()}
+            cur.execute(pk_query, params)
+            pk_columns = {(row["table_name"], row["column_name"]) for row in cur.fetchall()}
 
             # Get foreign keys
-            cur.execute(fk_query, (self._schema, table))
+            cur.execute(fk_query, params)
             fk_rows = cur.fetchall()
             fk_map = {
-                row["column_name"]: f"{row['references_table']}.{row['references_column']}"
+                (row["table_name"], row["column_name"]):
+                    f"{row['references_table']}.{row['references_column']}"
                 for row in fk_rows
             }
 
-        columns = []
+        columns_by_table: dict[str, list[ColumnInfo]] = {}
         for row in column_rows:
             # Build full type string
             dtype = row["data_type"]
@@ -161,16 +196,17 @@ class SchemaInspector:
                 else:
                     dtype = f"{dtype}({row['numeric_precision']})"
 
+            key = (row["table_name"], row["column_name"])
             col = ColumnInfo(
                 name=row["column_name"],
                 dtype=dtype,
                 nullable=row["is_nullable"] == "YES",
-                primary_key=row["column_name"] in pk_columns,
-                foreign_key=fk_map.get(row["column_name"]),
+                primary_key=key in pk_columns,
+                foreign_key=fk_map.get(key),
             )
-            columns.append(col)
+            columns_by_table.setdefault(row["table_name"], []).append(col)
 
-        return columns
+        return columns_by_table
 
     def get_foreign_keys(self, table: str) -> list[ForeignKey]:
         """Get foreign key relationships for a table.
@@ -186,8 +222,21 @@ class SchemaInspector:
             for fk in fks:
                 print(f"{fk.column} -> {fk.references_table}.{fk.references_column}")
         """
+        return self._get_foreign_keys_by_table(table).get(table, [])
+
+    def _get_foreign_keys_by_table(self, table: str | None = None) -> dict[str, list[ForeignKey]]:
+        """Get foreign keys for one table, or every table, in one query.
+
+        Args:
+            table: Table name, or None for all tables
+
+        Returns:
+            Dict mapping table name to its foreign keys (tables without
+            foreign keys are omitted)
+        """
         query = """
             SELECT
+                tc.table_name,
                 kcu.column_name,
                 ccu.table_name AS references_table,
                 ccu.column_name AS references_column,
@@ -200,24 +249,26 @@ class SchemaInspector:
                 ON tc.constraint_name = ccu.constraint_name
                 AND tc.table_schema = ccu.table_schema
             WHERE tc.constraint_type = 'FOREIGN KEY'
-              AND tc.table_schema = %s
-              AND tc.table_name = %s
-            ORDER BY kcu.column_name
+              AND tc.table_schema = %(schema)s
+              AND (%(table)s::text IS NULL OR tc.table_name = %(table)s)
+            ORDER BY tc.table_name, kcu.column_name
         """
 
         with self._conn.cursor(row_factory=dict_row) as cur:
-            cur.execute(query, (self._schema, table))
+            cur.execute(query, {"schema": self._schema, "table": table})
             rows = cur.fetchall()
 
-        return [
-            ForeignKey(
-                column=row["column_name"],
-                references_table=row["references_table"],
-                references_column=row["references_column"],
-                constraint_name=row["constraint_name"],
+        foreign_keys: dict[str, list[ForeignKey]] = {}
+        for row in rows:
+            foreign_keys.setdefault(row["table_name"], []).append(
+                ForeignKey(
+                    column=row["column_name"],
+                    references_table=row["references_table"],
+                    references_column=row["references_column"],
+                    constraint_name=row["constraint_name"],
+                )
             )
-            for row in rows
-        ]
+        return foreign_keys
 
     def get_primary_keys(self, table: str) -> list[str]:
         """Get primary key columns for a table.
@@ -281,6 +332,65 @@ class SchemaInspector:
             count_row = cur.fetchone()
             return int(count_row["cnt"]) if count_row else 0
 
+    def _get_row_estimates(self) -> dict[str, int]:
+        """Get pg_class row estimates for every table in the schema at once.
+
+        Returns:
+            Dict mapping table name to its estimate (-1 when the table has
+            never been analyzed)
+        """
+        query = """
+            SELECT c.relname, c.reltuples::bigint AS estimate
+            FROM pg_class c
+            JOIN pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s
+              AND c.relkind IN ('r', 'p')
+        """
+
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(query, (self._schema,))
+            return {row["relname"]: int(row["estimate"]) for row in cur.fetchall()}
+
+    def _get_catalog_fingerprint(self) -> str:
+        """Get a hash of the catalog rows that make up a schema snapshot.
+
+        Covers the xmin of every table, column and constraint row in the
+        schema plus the table row estimates, so it changes whenever DDL or
+        ANALYZE touches anything the snapshot reports.
+
+        Returns:
+            MD5 hex digest of the catalog state
+        """
+        query = """
+            WITH ns AS (
+                SELECT oid FROM pg_namespace WHERE nspname = %(schema)s
+            ),
+            rels AS (
+                SELECT c.oid, c.xmin, c.reltuples
+                FROM pg_class c
+                JOIN ns ON ns.oid = c.relnamespace
+                WHERE c.relkind IN ('r', 'p')
+            )
+            SELECT md5(coalesce(string_agg(entry, ',' ORDER BY entry), '')) AS fingerprint
+            FROM (
+                SELECT 'r' || oid::text || ':' || xmin::text || ':' || reltuples::text AS entry
+                FROM rels
+                UNION ALL
+                SELECT 'a' || a.attrelid::text || ':' || a.attnum::text || ':' || a.xmin::text
+                FROM pg_attribute a
+                JOIN rels ON rels.oid = a.attrelid
+                WHERE a.attnum > 0
+                UNION ALL
+                SELECT 'c' || con.oid::text || ':' || con.xmin::text
+                FROM pg_constraint con
+                JOIN ns ON ns.oid = con.connamespace
+            ) entries
+        """
+
+        with self._conn.cursor(row_factory=dict_row) as cur:
+            cur.execute(query, {"schema": self._schema})
+            return cur.fetchone()["fingerprint"]
+
     def get_table_info(self, table: str) -> TableInfo:
         """Get complete information for a single table.
 
@@ -300,7 +410,7 @@ class SchemaInspector:
             schema=self._schema,
         )
 
-    def get_schema_snapshot(self, database: str = "agentx") -> SchemaSnapshot:
+    def get_schema_snapshot(self, database: str = "agentx", use_cache: bool = True) -> SchemaSnapshot:
         """Capture a complete schema snapshot.
 
         Creates a snapshot of the entire schema including all tables,
@@ -309,6 +419,8 @@ class SchemaInspector:
 
         Args:
             database: Database name for the snapshot metadata
+            use_cache: Reuse a snapshot captured earlier in this process
+                while the catalog fingerprint is unchanged
 
         Returns:
             SchemaSnapshot object containing all schema information
@@ -319,6 +431,17 @@ class SchemaInspector:
                 if snapshot.has_column("users", "email"):
                     print("Schema is valid")
         """
+        cache_key = None
+        if use_cache:
+            cache_key = (database, self._schema, self._get_catalog_fingerprint())
+            with _snapshot_cache_lock:
+                cached = _snapshot_cache.get(cache_key)
+                if cached is not None:
+                    _snapshot_cache.move_to_end(cache_key)
+            if cached is not None:
+                logger.info(f"Reusing cached schema snapshot for {self._schema}")
+                return copy.deepcopy(cached)
+
         logger.info(f"Capturing schema snapshot for {self._schema}")
 
         tables_dict: dict[str, TableInfo] = {}
@@ -326,11 +449,28 @@ class SchemaInspector:
 
         table_names = self.get_tables()
 
+        # Catalog data for all tables is fetched in a handful of queries
+        # rather than several round-trips per table
+        columns_by_table = self._get_columns_by_table()
+        foreign_keys_by_table = self._get_foreign_keys_by_table()
+        row_estimates = self._get_row_estimates()
+
         for table_name in table_names:
-            table_info = self.get_table_info(table_name)
-            tables_dict[table_name] = table_info
+            row_count = row_estimates.get(table_name, -1)
+            if row_count < 0:
+                # Stats not available: fall back to an exact count, which
+                # the catalog fingerprint cannot vouch for
+                row_count = self.get_table_row_count(table_name)
+                cache_key = None
+
+            tables_dict[table_name] = TableInfo(
+                name=table_name,
+                columns=columns_by_table.get(table_name, []),
+                row_count=row_count,
+                schema=self._schema,
+            )
 
-            fks = self.get_foreign_keys(table_name)
+            fks = foreign_keys_by_table.get(table_name)
             if fks:
                 foreign_keys_dict[table_name] = fks
 
@@ -347,6 +487,12 @@ class SchemaInspector:
             f"{sum(len(fks) for fks in foreign_keys_dict.values())} foreign keys"
         )
 
+        if cache_key is not None:
+            with _snapshot_cache_lock:
+                _snapshot_cache[cache_key] = copy.deepcopy(snapshot)
+                if len(_snapshot_cache) > _SNAPSHOT_CACHE_SIZE:
+                    _snapshot_cache.popitem(last=False)
+
         return snapshot
 
     def get_indexes(self, table: str) -> list[dict]:
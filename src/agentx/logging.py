@@ -29,7 +29,7 @@ import logging
 import sys
 import traceback
 from contextlib import contextmanager
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields, asdict, is_dataclass
 from datetime import datetime
 from typing import Any, Dict, Optional
 from threading import local
@@ -147,6 +147,12 @@ class JSONFormatter(logging.Formatter):
             return {k: self._serialize(v) for k, v in value.items()}
         elif hasattr(value, "to_dict"):
             return value.to_dict()
+        elif is_dataclass(value) and not isinstance(value, type):
+            # Slotted dataclasses have no __dict__
+            return {
+                f.name: self._serialize(getattr(value, f.name))
+                for f in fields(value) if not f.name.startswith("_")
+            }
         elif hasattr(value, "__dict__"):
             return {k: self._serialize(v) for k, v in value.__dict__.items() if not k.startswith("_")}
         else:
@@ -8,14 +8,14 @@ Identifies:
 """
 
 from dataclasses import dataclass, field
-from typing import List, Optional, Set, Dict, Any
+from typing import List, Optional, Set, Dict, Any, Tuple, FrozenSet
 
 from ..dialects import get_dialect_config
 from ..infrastructure.models import SchemaSnapshot
-from .sql_parser import MultiDialectSQLParser, IdentifierSet
+from .sql_parser import MultiDialectSQLParser, IdentifierSet, ParsedSQL
 
 
-@dataclass
+@dataclass(slots=True)
 class HallucinationReport:
     """
     Report of hallucinated (phantom) identifiers in SQL.
@@ -57,7 +57,7 @@ class HallucinationReport:
         }
 
 
-@dataclass
+@dataclass(slots=True)
 class ValidationResult:
     """
     Complete validation result for a SQL query.
@@ -85,6 +85,24 @@ class ValidationResult:
         }
 
 
+@dataclass(slots=True)
+class _SchemaIndex:
+    """Case-insensitive lookups over a SchemaSnapshot, built once per schema."""
+    # lowercased table name -> lowercased column names of that table
+    table_columns: Dict[str, FrozenSet[str]]
+    all_columns: FrozenSet[str]  # lowercased column names across all tables
+
+    @classmethod
+    def build(cls, schema: SchemaSnapshot) -> "_SchemaIndex":
+        table_columns: Dict[str, FrozenSet[str]] = {}
+        all_columns: Set[str] = set()
+        for name, info in schema.tables.items():
+            columns = frozenset(col.name.lower() for col in info.columns)
+            table_columns.setdefault(name.lower(), columns)
+            all_columns.update(columns)
+        return cls(table_columns=table_columns, all_columns=frozenset(all_columns))
+
+
 class HallucinationDetector:
     """
     Dialect-aware hallucination detection for SQL queries.
@@ -108,11 +126,32 @@ class HallucinationDetector:
         except ValueError:
             self.config = None
 
+        self._indexed_schema: Optional[SchemaSnapshot] = None
+        self._schema_index: Optional[_SchemaIndex] = None
+
+    def _index_for(self, schema: SchemaSnapshot) -> _SchemaIndex:
+        """Get the lookup index for schema, rebuilding it when the schema changes."""
+        if schema is not self._indexed_schema:
+            self._schema_index = _SchemaIndex.build(schema)
+            self._indexed_schema = schema
+        return self._schema_index
+
+    def invalidate_schema(self) -> None:
+        """
+        Drop the cached schema index.
+
+        Only needed when a SchemaSnapshot is modified in place; passing a
+        new snapshot (e.g. after SQLExecutor.refresh_schema) rebuilds it.
+        """
+        self._indexed_schema = None
+        self._schema_index = None
+
     def detect(
         self,
         sql: str,
         schema: SchemaSnapshot,
-        dialect: str = None
+        dialect: str = None,
+        parsed: Optional[ParsedSQL] = None
     ) -> HallucinationReport:
         """
         Detect hallucinated identifiers in SQL query.
@@ -121,12 +160,14 @@ class HallucinationDetector:
             sql: SQL query to analyze
             schema: Database schema for validation
             dialect: Override dialect (optional)
+            parsed: Already-parsed form of sql in this dialect (optional)
 
         Returns:
             HallucinationReport with phantom identifiers and score
         """
         dialect = dialect or self.dialect
-        parsed = self.parser.parse(sql, dialect)
+        if parsed is None:
+            parsed = self.parser.parse(sql, dialect)
 
         if not parsed.is_valid:
             return HallucinationReport(
@@ -134,8 +175,9 @@ class HallucinationDetector:
                 hallucination_score=1.0,  # Can't validate, assume worst case
             )
 
-        # Detect phantom tables
-        phantom_tables = self._detect_phantom_tables(
+        # Detect phantom tables, resolving the rest against the schema once
+        # so column checks reuse the lookups
+        phantom_tables, resolved_tables = self._resolve_tables(
             parsed.identifiers.tables,
             parsed.identifiers.aliases,
             schema
@@ -144,7 +186,7 @@ class HallucinationDetector:
         # Detect phantom columns
         phantom_columns = self._detect_phantom_columns(
             parsed.identifiers.columns,
-            parsed.identifiers.tables,
+            resolved_tables,
             parsed.identifiers.aliases,
             schema,
             select_aliases=parsed.identifiers.select_aliases,
@@ -183,7 +225,8 @@ class HallucinationDetector:
         self,
         sql: str,
         schema: SchemaSnapshot,
-        dialect: str = None
+        dialect: str = None,
+        parsed: Optional[ParsedSQL] = None
     ) -> ValidationResult:
         """
         Validate SQL and return complete validation result.
@@ -194,12 +237,13 @@ class HallucinationDetector:
             sql: SQL query to validate
             schema: Database schema for validation
             dialect: Override dialect (optional)
+            parsed: Already-parsed form of sql in this dialect (optional)
 
         Returns:
             ValidationResult with errors, warnings, and hallucination report
         """
         dialect = dialect or self.dialect
-        report = self.detect(sql, schema, dialect)
+        report = self.detect(sql, schema, dialect, parsed)
 
         errors = []
         warnings = []
@@ -225,14 +269,18 @@ class HallucinationDetector:
             hallucination_report=report,
         )
 
-    def _detect_phantom_tables(
+    def _resolve_tables(
         self,
         tables: List[str],
         aliases: Dict[str, str],
         schema: SchemaSnapshot
-    ) -> List[str]:
+    ) -> Tuple[List[str], List[Tuple[str, str, FrozenSet[str]]]]:
         """
-        Find tables that don't exist in the schema.
+        Look up referenced tables in the schema in a single pass.
+
+        Returns the tables that don't exist (phantoms) and, for those that
+        do, (unqualified name, name as written, lowercased column names)
+        entries.
 
         Handles:
         - Simple table names
@@ -240,6 +288,8 @@ class HallucinationDetector:
         - CTE and subquery aliases (not phantom)
         """
         phantom = []
+        resolved = []
+        index = self._index_for(schema)
 
         # Get alias names that represent CTEs/subqueries
         cte_aliases = {
@@ -248,23 +298,25 @@ class HallucinationDetector:
         }
 
         for table in tables:
-            # Skip CTE/subquery aliases
-            if table in cte_aliases:
-                continue
-
             # Handle qualified names
             table_name = table.split(".")[-1]
 
             # Check if table exists (case-insensitive)
-            if not schema.has_table(table_name) and not schema.has_table(table):
+            table_columns = index.table_columns.get(table_name.lower())
+            if table_columns is None:
+                table_columns = index.table_columns.get(table.lower())
+            if table_columns is not None:
+                resolved.append((table_name, table, table_columns))
+            elif table not in cte_aliases:
+                # CTE/subquery aliases are not phantoms
                 phantom.append(table)
 
-        return phantom
+        return phantom, resolved
 
     def _detect_phantom_columns(
         self,
         columns: List[str],
-        tables: List[str],
+        resolved_tables: List[Tuple[str, str, FrozenSet[str]]],
         aliases: Dict[str, str],
         schema: SchemaSnapshot,
         select_aliases: Set[str] = None,
@@ -283,6 +335,28 @@ class HallucinationDetector:
         phantom = []
         select_aliases = select_aliases or set()
         cte_columns = cte_columns or {}
+        index = self._index_for(schema)
+
+        # Simple queries (no qualified column references) have nothing to
+        # resolve per table or alias: an unqualified column is valid if it
+        # is a SELECT alias, a CTE column or a column of any schema table
+        if not any("." in col for col in columns):
+            cte_column_names = set().union(*cte_columns.values())
+            return [
+                col for col in columns
+                if (col_lower := col.lower()) not in select_aliases
+                and col_lower not in cte_column_names
+                and col_lower not in index.all_columns
+            ]
+
+        # Alias lookups built once instead of rescanning aliases per column:
+        # target table -> its lowercased aliases, and lowercased alias -> the
+        # target of its first occurrence
+        aliases_by_target: Dict[str, List[str]] = {}
+        alias_targets: Dict[str, str] = {}
+        for alias, target in aliases.items():
+            aliases_by_target.setdefault(target, []).append(alias.lower())
+            alias_targets.setdefault(alias.lower(), target)
 
         # Build set of valid columns from all referenced tables
         valid_columns: Set[str] = set()
@@ -298,21 +372,21 @@ class HallucinationDetector:
             for col in cte_cols:
                 valid_qualified.add(f"{cte_name}.{col}")
 
-        # Add columns from explicitly referenced tables
-        for table in tables:
-            table_name = table.split(".")[-1]
-            table_info = schema.get_table(table_name) or schema.get_table(table)
+        # Add columns from explicitly referenced tables (as resolved by
+        # _resolve_tables)
+        for table_name, table, table_columns in resolved_tables:
+            table_aliases = aliases_by_target.get(table_name, [])
+            if table != table_name:
+                table_aliases = table_aliases + aliases_by_target.get(table, [])
 
-            if table_info:
-                for col in table_info.columns:
-                    col_lower = col.name.lower()
-                    valid_columns.add(col_lower)
-                    valid_qualified.add(f"{table_name.lower()}.{col_lower}")
+            valid_columns.update(table_columns)
+            table_lower = table_name.lower()
+            for col_lower in table_columns:
+                valid_qualified.add(f"{table_lower}.{col_lower}")
 
-                    # Also add alias-qualified columns
-                    for alias, target in aliases.items():
-                        if target == table_name or target == table:
-                            valid_qualified.add(f"{alias.lower()}.{col_lower}")
+                # Also add alias-qualified columns
+                for alias_lower in table_aliases:
+                    valid_qualified.add(f"{alias_lower}.{col_lower}")
 
         # Also add columns from aliased tables
         for alias, actual in aliases.items():
@@ -325,11 +399,10 @@ class HallucinationDetector:
                         valid_qualified.add(f"{alias_lower}.{col}")
                 continue
 
-            actual_table = schema.get_table(actual)
-            if actual_table:
-                for col in actual_table.columns:
-                    col_lower = col.name.lower()
-                    valid_columns.add(col_lower)
+            actual_columns = index.table_columns.get(actual.lower())
+            if actual_columns:
+                valid_columns.update(actual_columns)
+                for col_lower in actual_columns:
                     valid_qualified.add(f"{alias_lower}.{col_lower}")
 
         # Check each column
@@ -361,12 +434,8 @@ class HallucinationDetector:
                         continue
 
                 # Check if it's an alias
-                if table_part in {a.lower() for a in aliases}:
-                    actual = None
-                    for a, t in aliases.items():
-                        if a.lower() == table_part:
-                            actual = t
-                            break
+                if table_part in alias_targets:
+                    actual = alias_targets[table_part]
 
                     # For CTEs/subqueries, check if column is in cte_columns
                     if actual in {"(cte)", "(subquery)"}:
@@ -378,11 +447,7 @@ class HallucinationDetector:
                             continue
 
                 # Check if the column exists in any table
-                found_in_any = False
-                for table_info in schema.tables.values():
-                    if any(c.name.lower() == col_part for c in table_info.columns):
-                        found_in_any = True
-                        break
+                found_in_any = col_part in index.all_columns
 
                 # Also check if it's a SELECT alias or CTE column
                 if col_part in select_aliases or col_part in valid_columns:
@@ -393,13 +458,7 @@ class HallucinationDetector:
             else:
                 # Unqualified column not found anywhere
                 # Check across all schema tables
-                found_anywhere = False
-                for table_info in schema.tables.values():
-                    if any(c.name.lower() == col_name_only for c in table_info.columns):
-                        found_anywhere = True
-                        break
-
-                if not found_anywhere:
+                if col_name_only not in index.all_columns:
                     phantom.append(col)
 
         return phantom
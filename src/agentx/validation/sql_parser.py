@@ -13,12 +13,13 @@ Supports parsing and identifier extraction for:
 import sqlglot
 from sqlglot import exp
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Set
 
 from ..dialects import get_dialect_config
 
 
-@dataclass
+@dataclass(slots=True)
 class IdentifierSet:
     """Extracted SQL identifiers from a query."""
     tables: List[str] = field(default_factory=list)
@@ -34,8 +35,19 @@ class IdentifierSet:
         self.columns = list(dict.fromkeys(self.columns))
         self.functions = list(dict.fromkeys(self.functions))
 
+    def copy(self) -> "IdentifierSet":
+        """Return a copy whose containers can be modified independently."""
+        return IdentifierSet(
+            tables=list(self.tables),
+            columns=list(self.columns),
+            functions=list(self.functions),
+            aliases=dict(self.aliases),
+            select_aliases=set(self.select_aliases),
+            cte_columns={name: set(cols) for name, cols in self.cte_columns.items()},
+        )
+
 
-@dataclass
+@dataclass(slots=True)
 class ParsedSQL:
     """Result of parsing a SQL query."""
     ast: Any  # sqlglot AST
@@ -45,6 +57,17 @@ class ParsedSQL:
     is_valid: bool = True
     parse_error: Optional[str] = None
 
+    def copy(self) -> "ParsedSQL":
+        """Return a copy with its own AST and identifier containers."""
+        return ParsedSQL(
+            ast=self.ast.copy() if self.ast is not None else None,
+            dialect=self.dialect,
+            identifiers=self.identifiers.copy(),
+            raw_sql=self.raw_sql,
+            is_valid=self.is_valid,
+            parse_error=self.parse_error,
+        )
+
     @property
     def query_type(self) -> str:
         """Get the type of query (SELECT, INSERT, etc.)."""
@@ -77,6 +100,9 @@ class MultiDialectSQLParser:
             default_dialect: Default dialect to use when not specified
         """
         self.default_dialect = default_dialect
+        # The executor, hallucination detector and limit check all parse the
+        # same query, so recent results are kept per parser instance
+        self._parse_cached = lru_cache(maxsize=512)(self._parse_uncached)
 
     def parse(self, sql: str, dialect: str = None) -> ParsedSQL:
         """
@@ -87,10 +113,15 @@ class MultiDialectSQLParser:
             dialect: SQL dialect (sqlite, duckdb, postgresql, bigquery, etc.)
 
         Returns:
-            ParsedSQL object with AST and extracted identifiers
+            ParsedSQL object with AST and extracted identifiers.
+            Results are cached by (sql, dialect); each call returns its own
+            copy, so callers may modify it freely.
         """
         dialect = dialect or self.default_dialect
+        return self._parse_cached(sql, dialect).copy()
 
+    def _parse_uncached(self, sql: str, dialect: str) -> ParsedSQL:
+        """Parse SQL and extract identifiers (no caching)."""
         try:
             config = get_dialect_config(dialect)
             sqlglot_dialect = config.sqlglot_dialect
@@ -198,60 +229,65 @@ class MultiDialectSQLParser:
         if ast is None:
             return IdentifierSet()
 
-        # Extract CTEs first - we need their column definitions
-        for cte in ast.find_all(exp.CTE):
-            cte_name = None
-            if hasattr(cte, 'alias') and cte.alias:
-                cte_name = cte.alias
-                aliases[cte.alias] = "(cte)"
-
-            # Extract columns defined in this CTE
-            if cte_name:
-                cte_cols = self._extract_cte_columns(cte)
-                if cte_cols:
-                    cte_columns[cte_name.lower()] = cte_cols
-
-        # Extract SELECT aliases from all SELECT statements (including subqueries)
-        for select in ast.find_all(exp.Select):
-            sel_aliases = self._extract_select_aliases(select)
-            select_aliases.update(sel_aliases)
-
-        # Extract tables
-        for table in ast.find_all(exp.Table):
-            name = table.name
-            if table.db:
-                name = f"{table.db}.{name}"
-            if table.catalog:
-                name = f"{table.catalog}.{name}"
-            if name:
-                tables.append(name)
-
-            # Track table aliases
-            if table.alias:
-                aliases[table.alias] = table.name
-
-        # Extract columns
-        for col in ast.find_all(exp.Column):
-            name = col.name
-            if col.table:
-                name = f"{col.table}.{name}"
-            if name:
-                columns.append(name)
-
-        # Extract functions
-        for func in ast.find_all(exp.Func):
-            func_name = self._get_function_name(func)
-            if func_name:
-                functions.append(func_name)
-
-        # Extract aliases from subqueries
-        for subquery in ast.find_all(exp.Subquery):
-            if subquery.alias:
-                aliases[subquery.alias] = "(subquery)"
-                # Also extract columns from subquery
-                subq_cols = self._extract_subquery_columns(subquery)
-                if subq_cols:
-                    cte_columns[subquery.alias.lower()] = subq_cols
+        # One breadth-first walk (the order find_all would visit nodes in)
+        # classifies every node. Aliases are gathered per source and merged
+        # afterwards so subquery aliases still override table aliases, which
+        # override CTE names, as if each kind were collected in turn.
+        cte_aliases: Dict[str, str] = {}
+        table_aliases: Dict[str, str] = {}
+        subquery_aliases: Dict[str, str] = {}
+        subquery_columns: Dict[str, Set[str]] = {}
+
+        for node in ast.walk():
+            if isinstance(node, exp.Column):
+                name = node.name
+                if node.table:
+                    name = f"{node.table}.{name}"
+                if name:
+                    columns.append(name)
+
+            elif isinstance(node, exp.Table):
+                name = node.name
+                if node.db:
+                    name = f"{node.db}.{name}"
+                if node.catalog:
+                    name = f"{node.catalog}.{name}"
+                if name:
+                    tables.append(name)
+
+                # Track table aliases
+                if node.alias:
+                    table_aliases[node.alias] = node.name
+
+            elif isinstance(node, exp.Select):
+                # SELECT aliases from all SELECT statements (including subqueries)
+                select_aliases.update(self._extract_select_aliases(node))
+
+            elif isinstance(node, exp.CTE):
+                if node.alias:
+                    cte_aliases[node.alias] = "(cte)"
+                    # Extract columns defined in this CTE
+                    cte_cols = self._extract_cte_columns(node)
+                    if cte_cols:
+                        cte_columns[node.alias.lower()] = cte_cols
+
+            elif isinstance(node, exp.Subquery):
+                if node.alias:
+                    subquery_aliases[node.alias] = "(subquery)"
+                    # Also extract columns from subquery
+                    subq_cols = self._extract_subquery_columns(node)
+                    if subq_cols:
+                        subquery_columns[node.alias.lower()] = subq_cols
+
+            elif isinstance(node, exp.Func):
+                func_name = self._get_function_name(node)
+                if func_name:
+                    functions.append(func_name)
+
+        aliases.update(cte_aliases)
+        aliases.update(table_aliases)
+        aliases.update(subquery_aliases)
+        cte_columns.update(subquery_columns)
 
         return IdentifierSet(
             tables=tables,
@@ -294,10 +330,9 @@ class MultiDialectSQLParser:
         if isinstance(cte_query, exp.Select):
             select = cte_query
         else:
-            # Try to find a Select within the CTE
-            selects = list(cte_query.find_all(exp.Select))
-            if selects:
-                select = selects[0]
+            # First Select within the CTE; find stops at the first match
+            # instead of walking the whole subtree
+            select = cte_query.find(exp.Select)
 
         if select and select.expressions:
             for expr in select.expressions:
@@ -121,6 +121,10 @@ class TestA2AServer(unittest.TestCase):
         # Create server with test tasks
         cls.server = A2AServer(dialect="sqlite")
 
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.close()
+
     def test_benchmark_info(self):
         """Test getting benchmark info."""
         info = self.server.get_benchmark_info()
@@ -201,6 +205,12 @@ class TestA2AServer(unittest.TestCase):
             self.assertGreaterEqual(result.scores.overall, 0)
             self.assertLessEqual(result.scores.overall, 1)
 
+        # Resubmitting the same query is served from the cache as an
+        # independent copy
+        again = self.server.evaluate_submission(eval_req)
+        self.assertEqual(again.to_dict(), result.to_dict())
+        self.assertIsNot(again, result)
+
     def test_evaluate_invalid_query(self):
         """Test evaluating an invalid SQL query (phantom table)."""
         agent = self.server.register_agent(AgentInfo(
@@ -239,6 +249,50 @@ class TestA2AServer(unittest.TestCase):
         self.assertIsInstance(response, EvaluationResponse)
         self.assertEqual(len(response.results), 2)
         self.assertIn("total_submitted", response.summary)
+        # Parallel evaluation keeps submission order
+        self.assertEqual(
+            [r.task_id for r in response.results],
+            ["sqlite_simple_select", "sqlite_count"],
+        )
+
+    def test_cache_cleared_by_modifications(self):
+        """Cached query results are dropped once a submission changes data."""
+        server = A2AServer(dialect="sqlite")
+        try:
+            def submit(sql):
+                return server.evaluate_submission(EvaluationRequest(
+                    agent_id="", task_id="sqlite_simple_select", sql=sql,
+                ))
+
+            sql = "SELECT id FROM customers WHERE city = 'Boston'"
+            self.assertEqual(submit(sql).rows_returned, 0)
+            submit("INSERT INTO customers (id, name, city) VALUES (7, 'Gus Lee', 'Boston')")
+            self.assertEqual(submit(sql).rows_returned, 1)
+        finally:
+            server.close()
+
+    def test_batch_sees_serial_changes(self):
+        """Batch workers share the database the serial path writes to."""
+        server = A2AServer(dialect="sqlite")
+        try:
+            inserted = server.evaluate_submission(EvaluationRequest(
+                agent_id="",
+                task_id="sqlite_simple_select",
+                sql="INSERT INTO customers (id, name) VALUES (6, 'Fay Wong')",
+            ))
+            self.assertEqual(inserted.status, "success")
+
+            sql = "SELECT id, name FROM customers WHERE name = 'Fay Wong'"
+            response = server.evaluate_batch(BatchEvaluationRequest(
+                agent_id="",
+                submissions=[
+                    {"task_id": "sqlite_simple_select", "sql": sql},
+                    {"task_id": "sqlite_count", "sql": sql},
+                ],
+            ))
+            self.assertEqual([r.rows_returned for r in response.results], [1, 1])
+        finally:
+            server.close()
 
     def test_leaderboard(self):
         """Test leaderboard generation."""
@@ -253,6 +253,12 @@ def test_semantic_accuracy_scorer():
     print(f"  Overall: {result_wrong.overall_score:.2f}")
     assert result_wrong.overall_score < result_partial.overall_score, "Wrong data should score worse"
 
+    # Re-scoring identical inputs hits the memo cache and returns an independent copy
+    result_again = scorer.score(actual, expected)
+    assert result_again.to_dict() == result.to_dict(), "Cached result should match"
+    result_again.column_scores.clear()
+    assert scorer.score(actual, expected).column_scores, "Cached result should not be shared"
+
     print("\n✅ Semantic accuracy scorer tests passed!")
 
 
@@ -279,6 +285,10 @@ def test_error_taxonomy():
         print(f"  '{error[:40]}...'")
         print(f"    -> {classification.category.value} (severity: {classification.severity})")
 
+    # Column errors that mention the owning relation are still column errors
+    classification = classifier.classify('column "foo" of relation "users" does not exist')
+    assert classification.category == ErrorCategory.COLUMN_NOT_FOUND
+
     # Score multiple errors
     score, classifications = classifier.score_errors([
         "Table 'fake' does not exist",
@@ -326,6 +336,20 @@ def test_best_practices_scorer():
     print(f"  Violations: {report_implicit.violations}")
     assert "comma joins" in str(report_implicit.violations).lower() or "implicit" in str(report_implicit.violations).lower()
 
+    # A quoted '*' is a string literal, not a star projection
+    report_literal = scorer.score("SELECT '*' FROM users WHERE id = 1")
+    assert not report_literal.violations, "String literal should not count as SELECT *"
+
+    # Lookup exemption from the missing-WHERE penalty keeps its meaning:
+    # any LIMIT starting with 1 and numeric probes, but not string literals
+    assert scorer.score("SELECT name FROM users LIMIT 10").score == 1.0
+    assert scorer.score("SELECT 1").score == 1.0
+    assert scorer.score("SELECT 'x' FROM users").score == 0.95
+
+    # Text inside string literals is not mistaken for a comma join
+    report_quoted = scorer.score("SELECT 'FROM a, b' FROM t WHERE id = 1")
+    assert not report_quoted.violations, "String literal should not count as a comma join"
+
     print("\n✅ SQL best practices tests passed!")
 
 
@@ -416,6 +440,46 @@ def test_enhanced_scorer_integration():
 
     assert score_bad.overall < 0.3, "Invalid query should score low"
 
+    # Each score() returns an independent result; earlier payloads stay intact
+    payload = score.to_dict()
+    scorer.score(comparison_bad, execution_result_bad, sql="SELECT * FROM fake_users")
+    assert payload == score.to_dict(), "Scoring again must not alter an earlier score"
+
+    # Batch scoring matches scoring each query individually
+    batch = scorer.score_many(
+        [comparison, comparison_bad],
+        [execution_result, execution_result_bad],
+        sqls=[sql, "SELECT * FROM fake_users"],
+        expected_results=[expected, None],
+    )
+    assert [s.overall for s in batch] == [score.overall, score_bad.overall]
+
+    # A phantom table reported twice is only penalized once
+    execution_result_dup = ExecutionResult(
+        success=False,
+        is_valid=False,
+        validation_errors=["Table 'fake_users' does not exist"] * 2,
+    )
+    score_dup = scorer.score(comparison_bad, execution_result_dup)
+    assert score_dup.hallucination_details["phantom_tables"] == ["Table 'fake_users' does not exist"]
+    assert len(score_dup.error_analysis["errors"]) == 1
+    score_single = scorer.score(comparison_bad, ExecutionResult(
+        success=False,
+        is_valid=False,
+        validation_errors=["Table 'fake_users' does not exist"],
+    ))
+    assert score_dup.validation_score == score_single.validation_score
+    assert score_dup.overall == score_single.overall
+
+    # Fast-fail is opt-in and keeps the SQL-level scores of failed executions
+    execution_failed = ExecutionResult(success=False, error="connection reset")
+    full = scorer.score(comparison_bad, execution_failed, sql="SELECT * FROM users")
+    failed = EnhancedScorer(fast_fail=True).score(comparison_bad, execution_failed, sql="SELECT * FROM users")
+    assert failed.efficiency == 0.0 and failed.result_completeness == 0.0
+    assert failed.best_practices_score == full.best_practices_score < 1.0
+    assert failed.query_complexity_score == full.query_complexity_score
+    assert abs(failed.overall - full.overall) < 1e-9
+
     print("\n✅ Enhanced scorer integration tests passed!")
 
 
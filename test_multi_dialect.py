@@ -118,10 +118,69 @@ def test_sqlite_adapter():
     assert schema.has_column("users", "name")
     assert schema.has_column("users", "email")
 
+    # Statements in a transaction are committed together, or not at all
+    with adapter.transaction():
+        adapter.execute("INSERT INTO users (name, email) VALUES ('Dana', 'dana@test.com')")
+    try:
+        with adapter.transaction():
+            adapter.execute("INSERT INTO users (name, email) VALUES ('Eve', 'eve@test.com')")
+            raise RuntimeError("abort")
+    except RuntimeError:
+        pass
+    names = [row["name"] for row in adapter.execute("SELECT name FROM users ORDER BY id").data]
+    assert names == ["Alice", "Bob", "Charlie", "Dana"]
+
     adapter.close()
     print("\n✅ SQLite adapter tests passed!")
 
 
+def test_postgresql_adapter():
+    """Test PostgreSQL adapter DDL, DML and queries (needs a server)."""
+    connection_string = os.environ.get("PG_CONNECTION_STRING")
+    if not connection_string:
+        import pytest
+        pytest.skip("PG_CONNECTION_STRING is not set")
+
+    print("\n" + "=" * 60)
+    print("TEST: PostgreSQL Adapter")
+    print("=" * 60)
+
+    adapter = create_adapter("postgresql", connection_string=connection_string)
+    adapter.connect()
+
+    # DDL and DML run on a plain cursor; only queries are streamed
+    result = adapter.execute("DROP TABLE IF EXISTS agentx_adapter_test")
+    assert result.success, result.error
+    result = adapter.execute(
+        "CREATE TABLE agentx_adapter_test (id SERIAL PRIMARY KEY, name TEXT NOT NULL)"
+    )
+    assert result.success, result.error
+    try:
+        result = adapter.execute(
+            "INSERT INTO agentx_adapter_test (name) VALUES ('Alice'), ('Bob'), ('Charlie')"
+        )
+        assert result.success, result.error
+        assert result.rows_returned == 3
+
+        result = adapter.execute("UPDATE agentx_adapter_test SET name = 'Bobby' WHERE name = 'Bob'")
+        assert result.success, result.error
+        assert result.rows_returned == 1
+
+        result = adapter.execute("DELETE FROM agentx_adapter_test WHERE name = 'Charlie'")
+        assert result.success, result.error
+
+        result = adapter.execute("SELECT name FROM agentx_adapter_test ORDER BY id")
+        print(f"\nQuery result: {result.success}")
+        print(f"Data: {result.data}")
+        assert result.success, result.error
+        assert result.data == [{"name": "Alice"}, {"name": "Bobby"}]
+    finally:
+        adapter.execute("DROP TABLE IF EXISTS agentx_adapter_test")
+        adapter.close()
+
+    print("\n✅ PostgreSQL adapter tests passed!")
+
+
 def test_sql_parser():
     """Test multi-dialect SQL parser."""
     print("\n" + "=" * 60)
@@ -144,6 +203,13 @@ def test_sql_parser():
     assert "users" in parsed.identifiers.tables
     assert any("name" in c for c in parsed.identifiers.columns)
 
+    # Cached parses are handed out as copies, so changes do not leak
+    parsed.identifiers.tables.append("phantom")
+    parsed.ast.set("where", None)
+    again = parser.parse(sql)
+    assert again.identifiers.tables == ["users"]
+    assert again.ast.args.get("where") is not None
+
     # Test with JOINs
     sql = """
         SELECT u.name, o.total
@@ -265,6 +331,10 @@ def test_hallucination_detector():
 
     assert not validation.is_valid
 
+    # A pre-parsed query gives the same result as parsing it again
+    parsed = detector.parser.parse(sql, "sqlite")
+    assert detector.validate(sql, schema, parsed=parsed).errors == validation.errors
+
     adapter.close()
     print("\n✅ Hallucination detector tests passed!")
 
@@ -386,6 +456,8 @@ def main():
     try:
         test_dialect_registry()
         test_sqlite_adapter()
+        if os.environ.get("PG_CONNECTION_STRING"):
+            test_postgresql_adapter()
         test_sql_parser()
         test_hallucination_detector()
         test_sql_executor()